@@ -68,6 +68,7 @@ class ConnectionsAgent:
     async def collect_connection_profiles(self, max_results: int = 100) -> List[str]:
         """Collect profile URLs from connections (similar to search)"""
         profile_urls = []
+        seen = set()  # URLs already in profile_urls
         
         try:
             # Navigate to own profile first
@@ -99,7 +100,10 @@ class ConnectionsAgent:
                 links = await self._extract_connection_links()
                 
                 for link in links:
-                    if link not in profile_urls and len(profile_urls) < max_results:
+                    if len(profile_urls) >= max_results:
+                        break
+                    if link not in seen:
+                        seen.add(link)
                         profile_urls.append(link)
                 
                 logger.info(f"Collected {len(profile_urls)} profiles so far")
@@ -5,29 +5,67 @@ Scrape Agent: Extracts profile data
 import asyncio
 import logging
 import random
+import re
 from typing import Optional, Dict, List
+from asyncio_throttle import Throttler
 from scraper.browser_controller import BrowserController
 from scraper.data_extractor import DataExtractor
 from scraper.human_behavior import HumanBehavior
 
 logger = logging.getLogger(__name__)
 
+# Page phrases that mean the profile cannot be viewed
+ACCESS_ISSUES = [
+    "this profile is not available",
+    "you cannot view this profile",
+    "profile is not public",
+    "profile private",
+    "404 error",
+    "not found",
+]
+
+# One case-insensitive alternation, so the HTML is scanned once without a lowercased copy
+_ACCESS_ISSUE_RE = re.compile('|'.join(map(re.escape, ACCESS_ISSUES)), re.IGNORECASE)
+
 
 class ScrapeAgent:
     """Agent for scraping profile data"""
     
-    def __init__(self, browser_controller: BrowserController, data_extractor: DataExtractor):
+    def __init__(self, browser_controller: BrowserController, data_extractor: DataExtractor,
+                 requests_per_minute: Optional[int] = None, use_api: bool = False):
         self.browser = browser_controller
         self.data_extractor = data_extractor
+        # Try LinkedIn's JSON API with the session cookies before driving the page
+        self.use_api = use_api
         self.human_behavior = HumanBehavior()
+        # Token bucket shared by all in-flight scrapes (None = unthrottled)
+        self.throttler = Throttler(rate_limit=requests_per_minute, period=60) if requests_per_minute else None
         # Allow data_extractor to call back to us for contact info extraction
         self.data_extractor.scrape_agent = self
     
     async def scrape_profile(self, profile_url: str) -> Optional[Dict]:
+        """Scrape single profile, waiting for a rate-limit token first"""
+        # Recently scraped: no navigation, no token spent
+        cached = self.data_extractor.get_cached_profile(profile_url)
+        if cached:
+            logger.info(f"[CACHE] Reusing recent scrape of {profile_url}")
+            return cached
+        
+        if self.throttler:
+            async with self.throttler:
+                return await self._navigate_and_extract(profile_url)
+        return await self._navigate_and_extract(profile_url)
+    
+    async def _navigate_and_extract(self, profile_url: str) -> Optional[Dict]:
         """Scrape single profile with comprehensive extraction"""
         try:
             logger.info(f"[SCRAPE] Scraping profile: {profile_url}")
             
+            if self.use_api:
+                profile_data = await self.data_extractor.extract_profile_via_api(self.browser.context, profile_url)
+                if profile_data:
+                    return profile_data
+            
             # Navigate to profile with extended timeout and retry
             if not await self.browser.navigate(profile_url, wait_until='domcontentloaded', timeout=60000, max_retries=3):
                 logger.warning(f"[WARN] Failed to navigate to {profile_url}")
@@ -99,19 +137,7 @@ class ScrapeAgent:
         """Check if profile has access restrictions - strict check"""
         try:
             page_content = await self.browser.get_page_content()
-            page_text = page_content.lower()
-            
-            # More specific access issue patterns
-            access_issues = [
-                "this profile is not available",
-                "you cannot view this profile",
-                "profile is not public",
-                "profile private",
-                "404 error",
-                "not found",
-            ]
-            
-            return any(issue.lower() in page_text for issue in access_issues)
+            return _ACCESS_ISSUE_RE.search(page_content) is not None
             
         except Exception as e:
             logger.debug(f"Error checking access: {e}")
@@ -250,7 +276,7 @@ class ScrapeAgent:
                         await self.human_behavior.random_delay(0.5, 1)
                         
                         # Extract STRUCTURED contact info from overlay
-                        page_html = await self.browser.page.content()
+                        page_html = await self.browser.get_page_content()
                         contact_text = await self._parse_overlay_html(page_html)
                         
                         if contact_text and len(contact_text) > 50:
@@ -279,7 +305,7 @@ class ScrapeAgent:
     
     async def scrape_multiple_profiles(self, profile_urls: List[str], 
                                      delay_range: tuple = (15, 30)) -> Dict[str, Dict]:
-        """Scrape multiple profiles with intelligent delays"""
+        """Scrape multiple profiles with intelligent delays and the shared rate limit"""
         results = {
             'total': len(profile_urls),
             'successful': 0,
@@ -287,11 +313,14 @@ class ScrapeAgent:
             'profiles': []
         }
         
+        # One profile at a time: navigation, the contact overlay and section expansion
+        # all drive the controller's single page
         for i, profile_url in enumerate(profile_urls, 1):
             try:
                 logger.info(f"Progress: {i}/{len(profile_urls)} ({i/len(profile_urls)*100:.1f}%)")
                 
-                # Intelligent rate limiting
+                # Randomized gap between profiles; the throttler in scrape_profile
+                # additionally caps the overall requests per minute
                 if i > 1:
                     await self._adaptive_delay(i, len(profile_urls), delay_range)
                 
@@ -319,12 +348,12 @@ class ScrapeAgent:
         # Increase delay as progress increases (LinkedIn detects patterns)
         progress_factor = current / total
         
-        if progress_factor > 0.7:  # Last 30%
-            delay_min = base_min * 1.5
-            delay_max = base_max * 1.5
-        elif progress_factor > 0.9:  # Last 10%
+        if progress_factor > 0.9:  # Last 10%
             delay_min = base_min * 2.0
             delay_max = base_max * 2.0
+        elif progress_factor > 0.7:  # Last 30%
+            delay_min = base_min * 1.5
+            delay_max = base_max * 1.5
         else:
             delay_min = base_min
             delay_max = base_max
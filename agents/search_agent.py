@@ -24,6 +24,7 @@ class SearchAgent:
                              location: Optional[str] = None) -> List[str]:
         """Search LinkedIn and collect profile URLs - with improved retry logic"""
         profile_urls = []
+        seen = set()  # URLs already in profile_urls
         
         try:
             logger.info(f"🔍 Searching for profiles: '{query}'")
@@ -59,7 +60,10 @@ class SearchAgent:
                 links = await self._extract_profile_links()
                 
                 for link in links:
-                    if link not in profile_urls and len(profile_urls) < max_results:
+                    if len(profile_urls) >= max_results:
+                        break
+                    if link not in seen:
+                        seen.add(link)
                         profile_urls.append(link)
                 
                 logger.info(f"Collected {len(profile_urls)} profiles so far")
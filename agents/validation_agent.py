@@ -168,3 +168,34 @@ class ValidationAgent:
         logger.info(f"Batch validation: {results['valid']}/{results['total']} valid")
         
         return results
+    
+    @staticmethod
+    def merge_batch_results(chunk_results: List[Dict]) -> Dict:
+        """Combine batch_validate results computed over separate chunks"""
+        results = {
+            'total': 0,
+            'valid': 0,
+            'invalid': 0,
+            'avg_completeness': 0,
+            'avg_score': 0,
+            'profiles': []
+        }
+        
+        for chunk in chunk_results:
+            results['total'] += chunk['total']
+            results['valid'] += chunk['valid']
+            results['invalid'] += chunk['invalid']
+            results['profiles'].extend(chunk['profiles'])
+        
+        # Recompute averages from per-profile entries (chunk averages are rounded)
+        entries = results['profiles']
+        if entries:
+            results['avg_completeness'] = round(sum(p['completeness'] for p in entries) / len(entries), 2)
+            results['avg_score'] = round(sum(p['score'] for p in entries) / len(entries), 2)
+        
+        return results
+
+
+def validate_chunk(profiles: List[Dict]) -> Dict:
+    """Validate a chunk of profiles (module-level so it can run in a worker process)"""
+    return ValidationAgent().batch_validate(profiles)
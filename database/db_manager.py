@@ -6,19 +6,44 @@ import sqlite3
 import json
 import hashlib
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional
 
+from utils.helpers import with_scraped_at
+
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dump_profile(data: Dict) -> str:
+    """Serialize profile data for the data column (orjson when installed)"""
+    if ORJSON_AVAILABLE:
+        # Same layout as the json fallback: UTF-8 kept as-is, 2-space indent
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+# Parser for the data column
+_load_profile = orjson.loads if ORJSON_AVAILABLE else json.loads
+
 
 class DatabaseManager:
     """Advanced database management for scraping progress and data storage"""
     
+    # Seconds a get_scraping_stats() result is reused before re-querying
+    STATS_CACHE_TTL = 5.0
+    
     def __init__(self, db_path: str = 'data/linkedin_scraper.db'):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._stats_cache: Optional[tuple] = None  # (timestamp, stats)
         self._init_database()
     
     def _init_database(self):
@@ -86,6 +111,8 @@ class DatabaseManager:
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_status ON profiles(status)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_url ON profiles(profile_url)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_created ON profiles(created_at)')
+        # Covering index so the stats aggregate never touches the table rows
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_status_completeness ON profiles(status, data_completeness)')
         
         conn.commit()
         conn.close()
@@ -96,6 +123,10 @@ class DatabaseManager:
         """Get database connection"""
         return sqlite3.connect(str(self.db_path))
     
+    def _invalidate_stats_cache(self):
+        """Drop cached statistics after the profiles table changes"""
+        self._stats_cache = None
+    
     def add_profiles(self, profile_urls: List[str], session_id: Optional[int] = None) -> int:
         """Add profiles to scraping queue"""
         conn = self._get_connection()
@@ -127,6 +158,7 @@ class DatabaseManager:
         
         conn.commit()
         conn.close()
+        self._invalidate_stats_cache()
         
         logger.info(f"Added {added} profiles to queue")
         return added
@@ -142,9 +174,10 @@ class DatabaseManager:
                 SET status = 'completed', data = ?, scraped_at = CURRENT_TIMESTAMP,
                     updated_at = CURRENT_TIMESTAMP, data_completeness = ?
                 WHERE profile_url = ?
-            ''', (json.dumps(data, ensure_ascii=False, indent=2), completeness, profile_url))
+            ''', (_dump_profile(with_scraped_at(data)), completeness, profile_url))
             
             conn.commit()
+            self._invalidate_stats_cache()
             logger.debug(f"Saved profile data: {data.get('name', 'Unknown')}")
             
         except Exception as e:
@@ -166,12 +199,39 @@ class DatabaseManager:
             ''', (error[:500], profile_url))  # Limit error length
             
             conn.commit()
+            self._invalidate_stats_cache()
             
         except Exception as e:
             logger.error(f"Error marking profile failed: {e}")
         finally:
             conn.close()
     
+    def bulk_mark_failed(self, profile_urls: List[str], error: str) -> int:
+        """Mark several profiles as failed in a single transaction"""
+        if not profile_urls:
+            return 0
+        
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.executemany('''
+                UPDATE profiles 
+                SET status = 'failed', error = ?, retry_count = retry_count + 1,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE profile_url = ?
+            ''', [(error[:500], url) for url in profile_urls])
+            
+            conn.commit()
+            self._invalidate_stats_cache()
+            return cursor.rowcount
+            
+        except Exception as e:
+            logger.error(f"Error marking profiles failed: {e}")
+            return 0
+        finally:
+            conn.close()
+    
     def is_profile_scraped(self, profile_url: str) -> bool:
         """Check if profile is already scraped"""
         conn = self._get_connection()
@@ -212,26 +272,26 @@ class DatabaseManager:
     
     def get_scraping_stats(self) -> Dict:
         """Get comprehensive scraping statistics"""
+        if self._stats_cache and time.monotonic() - self._stats_cache[0] < self.STATS_CACHE_TTL:
+            return dict(self._stats_cache[1])
+        
         conn = self._get_connection()
         cursor = conn.cursor()
         
         try:
-            # Get counts
-            cursor.execute('SELECT COUNT(*) FROM profiles')
-            total = cursor.fetchone()[0]
-            
-            cursor.execute('SELECT COUNT(*) FROM profiles WHERE status = "completed"')
-            completed = cursor.fetchone()[0]
-            
-            cursor.execute('SELECT COUNT(*) FROM profiles WHERE status = "failed"')
-            failed = cursor.fetchone()[0]
-            
-            cursor.execute('SELECT COUNT(*) FROM profiles WHERE status = "pending"')
-            pending = cursor.fetchone()[0]
+            # Single aggregate over the (status, data_completeness) index
+            cursor.execute('''
+                SELECT status, COUNT(*), AVG(data_completeness)
+                FROM profiles
+                GROUP BY status
+            ''')
+            by_status = {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
             
-            # Get average completeness
-            cursor.execute('SELECT AVG(data_completeness) FROM profiles WHERE status = "completed"')
-            avg_completeness = cursor.fetchone()[0] or 0
+            total = sum(count for count, _ in by_status.values())
+            completed = by_status.get('completed', (0, 0))[0]
+            failed = by_status.get('failed', (0, 0))[0]
+            pending = by_status.get('pending', (0, 0))[0]
+            avg_completeness = by_status.get('completed', (0, 0))[1] or 0
             
             # Get success rate
             success_rate = (completed / total * 100) if total > 0 else 0
@@ -249,7 +309,8 @@ class DatabaseManager:
         finally:
             conn.close()
         
-        return stats
+        self._stats_cache = (time.monotonic(), stats)
+        return dict(stats)
     
     def get_all_scraped_data(self, min_completeness: float = 0) -> List[Dict]:
         """Get all successfully scraped profiles"""
@@ -268,7 +329,7 @@ class DatabaseManager:
             data = []
             for row in results:
                 try:
-                    data.append(json.loads(row[0]))
+                    data.append(_load_profile(row[0]))
                 except:
                     continue
             
@@ -369,6 +430,32 @@ class DatabaseManager:
             
             deleted_count = cursor.rowcount
             conn.commit()
+            self._invalidate_stats_cache()
+            
+        finally:
+            conn.close()
+        
+        return deleted_count
+    
+    def cleanup_old_data_batch(self, days: int = 30, batch_size: int = 1000) -> int:
+        """Delete at most batch_size old failed profiles (keeps the write lock short)"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('''
+                DELETE FROM profiles 
+                WHERE id IN (
+                    SELECT id FROM profiles 
+                    WHERE status = 'failed' AND created_at < datetime("now", ?)
+                    LIMIT ?
+                )
+            ''', (f'-{days} days', batch_size))
+            
+            deleted_count = cursor.rowcount
+            conn.commit()
+            if deleted_count:
+                self._invalidate_stats_cache()
             
         finally:
             conn.close()
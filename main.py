@@ -14,6 +14,7 @@ Features:
 import asyncio
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import logging
@@ -23,20 +24,27 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 # Import components
-from utils.logger import setup_logging, get_logger
+from utils.logger import setup_logging, shutdown_logging, get_logger
 from utils.config import Config
-from utils.helpers import print_banner, print_config_info
-from utils.exporter import DataExporter
+from utils.helpers import print_banner, print_config_info, async_input
 from scraper.browser_controller import BrowserController
+from scraper.browser_pool import shutdown_browser_pool
 from scraper.data_extractor import DataExtractor
 from agents.search_agent import SearchAgent
 from agents.scrape_agent import ScrapeAgent
-from agents.validation_agent import ValidationAgent
-from agents.connections_agent import ConnectionsAgent
+from agents.validation_agent import ValidationAgent, validate_chunk
 from database.db_manager import DatabaseManager
 
 logger = logging.getLogger(__name__)
 
+# Profiles per validation task submitted to the process pool
+VALIDATION_CHUNK_SIZE = 256
+
+# Background cleanup: seconds between passes, rows per DELETE, pause between DELETEs
+CLEANUP_INTERVAL = 300
+CLEANUP_BATCH_SIZE = 1000
+CLEANUP_BATCH_PAUSE = 1.0
+
 
 class LinkedInScraperApp:
     """Main application with complete workflow"""
@@ -50,8 +58,14 @@ class LinkedInScraperApp:
         self.search_agent: SearchAgent = None
         self.scrape_agent: ScrapeAgent = None
         self.validation_agent: ValidationAgent = None
-        self.connections_agent: ConnectionsAgent = None
-        self.exporter: DataExporter = None
+        # Created on first use so pandas/openpyxl are only imported when needed
+        self.connections_agent = None
+        self.exporter = None
+        self._val_pool: ProcessPoolExecutor = None
+        self._cleanup_days = None  # retention set from the cleanup menu
+        self._cleanup_requested: asyncio.Event = None
+        self._cleanup_idle: asyncio.Event = None  # clear while a cleanup pass is queued or running
+        self._cleanup_task: asyncio.Task = None
         self.start_time = None
     
     async def initialize(self) -> bool:
@@ -62,8 +76,11 @@ class LinkedInScraperApp:
             # Browser controller
             self.browser_controller = BrowserController(
                 headless=self.config.HEADLESS,
-                use_proxy=self.config.browser.get('proxy_server') if self.config.browser.get('use_proxy') else None,
-                use_stealth=self.config.scraping['use_stealth']
+                use_proxy=(self.config.browser.get('proxy_servers') or self.config.browser.get('proxy_server'))
+                          if self.config.browser.get('use_proxy') else None,
+                use_stealth=self.config.scraping['use_stealth'],
+                block_resources=self.config.browser.get('block_resources'),
+                personas=self.config.browser.get('personas')
             )
             
             if not await self.browser_controller.initialize():
@@ -71,12 +88,28 @@ class LinkedInScraperApp:
                 return False
             
             # Components
-            self.data_extractor = DataExtractor()
+            self.data_extractor = DataExtractor(
+                cache_profiles=self.config.scraping.get('cache_profiles', True)
+            )
+            await self.data_extractor.attach(self.browser_controller)
             self.search_agent = SearchAgent(self.browser_controller)
-            self.scrape_agent = ScrapeAgent(self.browser_controller, self.data_extractor)
+            self.scrape_agent = ScrapeAgent(
+                self.browser_controller,
+                self.data_extractor,
+                requests_per_minute=self.config.scraping['requests_per_minute'],
+                use_api=self.config.scraping.get('use_voyager_api', False)
+            )
             self.validation_agent = ValidationAgent()
-            self.connections_agent = ConnectionsAgent(self.browser_controller)
-            self.exporter = DataExporter(self.config.export['export_path'])
+            
+            # Validation is CPU-bound; run it in worker processes off the event loop
+            self._val_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+            
+            # Old-data cleanup runs in small batches whenever the loop is idle
+            # (menu prompts are read off the loop, so that includes time spent at the menu)
+            self._cleanup_requested = asyncio.Event()
+            self._cleanup_idle = asyncio.Event()
+            self._cleanup_idle.set()
+            self._cleanup_task = asyncio.create_task(self._background_cleanup())
             
             logger.info("[OK] All components initialized successfully")
             return True
@@ -85,6 +118,97 @@ class LinkedInScraperApp:
             logger.error(f"[X] Initialization failed: {e}")
             return False
     
+    async def _validate_profiles(self, profiles: list) -> dict:
+        """Validate profiles in chunks on the process pool and merge the results"""
+        if not self._val_pool or not profiles:
+            return self.validation_agent.batch_validate(profiles)
+        
+        loop = asyncio.get_running_loop()
+        chunks = [
+            profiles[i:i + VALIDATION_CHUNK_SIZE]
+            for i in range(0, len(profiles), VALIDATION_CHUNK_SIZE)
+        ]
+        chunk_results = await asyncio.gather(*(
+            loop.run_in_executor(self._val_pool, validate_chunk, chunk)
+            for chunk in chunks
+        ))
+        results = ValidationAgent.merge_batch_results(chunk_results)
+        # Worker processes have no log handlers, so report the batch summary from here
+        logger.info(f"Batch validation: {results['valid']}/{results['total']} valid")
+        return results
+    
+    async def _background_cleanup(self):
+        """Periodically delete old failed profiles in bounded batches"""
+        while True:
+            try:
+                await asyncio.wait_for(self._cleanup_requested.wait(), timeout=CLEANUP_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            requested = self._cleanup_requested.is_set()
+            self._cleanup_requested.clear()
+            
+            if self._cleanup_days is None:
+                self._mark_cleanup_idle()
+                continue
+            
+            self._cleanup_idle.clear()
+            try:
+                deleted_total = 0
+                while True:
+                    deleted = await asyncio.to_thread(
+                        self.db.cleanup_old_data_batch, self._cleanup_days, CLEANUP_BATCH_SIZE
+                    )
+                    deleted_total += deleted
+                    if deleted < CLEANUP_BATCH_SIZE:
+                        break
+                    # Let scrape writes in between batches
+                    await asyncio.sleep(CLEANUP_BATCH_PAUSE)
+                
+                # Always report a pass the user asked for from the menu, even if nothing matched
+                if deleted_total or requested:
+                    logger.info(f"[OK] Cleanup deleted {deleted_total} failed records older than {self._cleanup_days} days")
+            except Exception as e:
+                logger.error(f"[X] Background cleanup error: {e}")
+            finally:
+                self._mark_cleanup_idle()
+    
+    def _mark_cleanup_idle(self):
+        """Signal that no cleanup pass is running (unless another was requested meanwhile)"""
+        if not self._cleanup_requested.is_set():
+            self._cleanup_idle.set()
+    
+    def _get_exporter(self):
+        """Get the data exporter, importing it on first use"""
+        if self.exporter is None:
+            from utils.exporter import DataExporter
+            self.exporter = DataExporter(self.config.export['export_path'])
+        return self.exporter
+    
+    def _get_connections_agent(self):
+        """Get the connections agent, importing it on first use"""
+        if self.connections_agent is None:
+            from agents.connections_agent import ConnectionsAgent
+            self.connections_agent = ConnectionsAgent(self.browser_controller)
+        return self.connections_agent
+    
+    def _format_stats(self, stats: dict) -> str:
+        """Build the final statistics block as a single log message"""
+        return "\n".join([
+            f"\n{'='*60}",
+            "FINAL STATISTICS",
+            f"{'='*60}",
+            f"Total Profiles: {stats['total']}",
+            f"Completed: {stats['completed']}",
+            f"Failed: {stats['failed']}",
+            f"Pending: {stats['pending']}",
+            f"Success Rate: {stats['success_rate']}",
+            f"Avg Completeness: {stats['avg_completeness']}",
+            f"Database Size: {self.db.get_db_size()}",
+            # From config, not the exporter - building it would import pandas just for a path
+            f"Export Path: {Path(self.config.export['export_path'])}",
+            f"{'='*60}\n",
+        ])
+    
     async def login(self) -> bool:
         """Login to LinkedIn"""
         try:
@@ -96,7 +220,8 @@ class LinkedInScraperApp:
                 return False
             
             # Navigate to login
-            if not await self.browser_controller.navigate('https://www.linkedin.com/login', timeout=60000, max_retries=3):
+            if not await self.browser_controller.navigate('https://www.linkedin.com/login', timeout=60000, max_retries=3,
+                                                          wait_for='#username'):
                 return False
             
             # Wait for page to load
@@ -202,13 +327,12 @@ class LinkedInScraperApp:
                         scraped_urls.add(profile_url)
 
                 # Mark any profile URLs that were not scraped as failed (increase retry count)
-                for url in profile_urls:
-                    if url not in scraped_urls:
-                        self.db.mark_profile_failed(url, "Navigation/Access failed or blocked")
+                failed_urls = [url for url in profile_urls if url not in scraped_urls]
+                self.db.bulk_mark_failed(failed_urls, "Navigation/Access failed or blocked")
                 
                 # Validate scraped data
                 logger.info("Validating scraped data...")
-                validation_results = self.validation_agent.batch_validate(scrape_results['profiles'])
+                validation_results = await self._validate_profiles(scrape_results['profiles'])
                 
                 logger.info(f"[OK] Validation: {validation_results['valid']}/{validation_results['total']} valid")
                 logger.info(f"📊 Avg Completeness: {validation_results['avg_completeness']}%")
@@ -231,7 +355,7 @@ class LinkedInScraperApp:
             logger.info("EXPORTING DATA")
             logger.info(f"{'='*60}\n")
             
-            export_results = self.exporter.export_all_formats(all_profiles)
+            export_results = self._get_exporter().export_all_formats(all_profiles)
             
             for format_name, success in export_results.items():
                 if success:
@@ -243,18 +367,7 @@ class LinkedInScraperApp:
             
             # Final statistics
             final_stats = self.db.get_scraping_stats()
-            logger.info(f"\n{'='*60}")
-            logger.info("FINAL STATISTICS")
-            logger.info(f"{'='*60}")
-            logger.info(f"Total Profiles: {final_stats['total']}")
-            logger.info(f"Completed: {final_stats['completed']}")
-            logger.info(f"Failed: {final_stats['failed']}")
-            logger.info(f"Pending: {final_stats['pending']}")
-            logger.info(f"Success Rate: {final_stats['success_rate']}")
-            logger.info(f"Avg Completeness: {final_stats['avg_completeness']}")
-            logger.info(f"Database Size: {self.db.get_db_size()}")
-            logger.info(f"Export Path: {self.exporter.get_export_path()}")
-            logger.info(f"{'='*60}\n")
+            logger.info(self._format_stats(final_stats))
             
         except Exception as e:
             logger.error(f"[X] Workflow error: {e}")
@@ -280,11 +393,11 @@ class LinkedInScraperApp:
             )
             
             # Validate
-            validation_results = self.validation_agent.batch_validate(results['profiles'])
+            validation_results = await self._validate_profiles(results['profiles'])
             logger.info(f"[OK] Validation: {validation_results['valid']}/{validation_results['total']} valid")
             
             # Export
-            self.exporter.export_all_formats(results['profiles'])
+            self._get_exporter().export_all_formats(results['profiles'])
             
             # Stats
             final_stats = self.db.get_scraping_stats()
@@ -301,7 +414,7 @@ class LinkedInScraperApp:
             logger.info(f"{'='*60}\n")
             
             # Use connections agent to collect and scrape
-            result = await self.connections_agent.scrape_connection_profiles(
+            result = await self._get_connections_agent().scrape_connection_profiles(
                 scrape_agent=self.scrape_agent,
                 db_manager=self.db,
                 max_profiles=max_profiles
@@ -316,7 +429,7 @@ class LinkedInScraperApp:
             
             if all_profiles:
                 logger.info("\nValidating scraped data...")
-                validation_results = self.validation_agent.batch_validate(all_profiles)
+                validation_results = await self._validate_profiles(all_profiles)
                 
                 logger.info(f"[OK] Validation: {validation_results['valid']}/{validation_results['total']} valid")
                 logger.info(f"📊 Avg Completeness: {validation_results['avg_completeness']}%")
@@ -327,7 +440,7 @@ class LinkedInScraperApp:
                 logger.info("EXPORTING DATA")
                 logger.info(f"{'='*60}\n")
                 
-                export_results = self.exporter.export_all_formats(all_profiles)
+                export_results = self._get_exporter().export_all_formats(all_profiles)
                 
                 for format_name, success in export_results.items():
                     if success:
@@ -335,18 +448,7 @@ class LinkedInScraperApp:
             
             # Final statistics
             final_stats = self.db.get_scraping_stats()
-            logger.info(f"\n{'='*60}")
-            logger.info("FINAL STATISTICS")
-            logger.info(f"{'='*60}")
-            logger.info(f"Total Profiles: {final_stats['total']}")
-            logger.info(f"Completed: {final_stats['completed']}")
-            logger.info(f"Failed: {final_stats['failed']}")
-            logger.info(f"Pending: {final_stats['pending']}")
-            logger.info(f"Success Rate: {final_stats['success_rate']}")
-            logger.info(f"Avg Completeness: {final_stats['avg_completeness']}")
-            logger.info(f"Database Size: {self.db.get_db_size()}")
-            logger.info(f"Export Path: {self.exporter.get_export_path()}")
-            logger.info(f"{'='*60}\n")
+            logger.info(self._format_stats(final_stats))
             
         except Exception as e:
             logger.error(f"[X] Connections scraping error: {e}")
@@ -368,13 +470,13 @@ class LinkedInScraperApp:
             
             logger.info(f"Exporting {len(profiles)} profiles...")
             
-            results = self.exporter.export_all_formats(profiles)
+            results = self._get_exporter().export_all_formats(profiles)
             
             for format_name, success in results.items():
                 if success:
                     logger.info(f"[OK] Exported to {format_name.upper()}")
             
-            logger.info(f"\n[OK] Export completed: {self.exporter.get_export_path()}")
+            logger.info(f"\n[OK] Export completed: {self._get_exporter().get_export_path()}")
             
         except Exception as e:
             logger.error(f"[X] Export error: {e}")
@@ -395,11 +497,11 @@ class LinkedInScraperApp:
         
         while True:
             try:
-                choice = input("\nEnter your choice (0-6): ").strip()
+                choice = (await async_input("\nEnter your choice (0-6): ")).strip()
                 if choice in ['0', '1', '2', '3', '4', '5', '6']:
                     return int(choice)
                 print("[X] Invalid choice. Please try again.")
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError):
                 return 0
     
     async def show_statistics(self):
@@ -424,9 +526,13 @@ class LinkedInScraperApp:
     async def cleanup_data(self):
         """Cleanup old data"""
         logger.info("\n🧹 CLEANING UP OLD DATA")
-        days = int(input("Delete data older than (days): "))
-        deleted = self.db.cleanup_old_data(days)
-        logger.info(f"[OK] Deleted {deleted} old records")
+        days = int(await async_input("Delete data older than (days): "))
+        # Hand the retention to the background task instead of deleting inline; it runs
+        # while the menu waits for input and reports the deleted count when done
+        self._cleanup_days = days
+        self._cleanup_idle.clear()
+        self._cleanup_requested.set()
+        logger.info(f"[OK] Cleanup of data older than {days} days started in background")
     
     async def run(self):
         """Run main application loop"""
@@ -457,21 +563,21 @@ class LinkedInScraperApp:
                     break
                 elif choice == 1:
                     # Search & Scrape
-                    queries = input("\nEnter search queries (comma-separated): ").split(',')
+                    queries = (await async_input("\nEnter search queries (comma-separated): ")).split(',')
                     queries = [q.strip() for q in queries if q.strip()]
                     
                     if queries:
-                        max_profiles = int(input("Max profiles per query (default 50): ") or "50")
+                        max_profiles = int(await async_input("Max profiles per query (default 50): ") or "50")
                         await self.workflow_search_and_scrape(queries, max_profiles)
                 
                 elif choice == 2:
                     # Scrape Connections
-                    max_profiles = int(input("Max connection profiles to scrape (default 50): ") or "50")
+                    max_profiles = int(await async_input("Max connection profiles to scrape (default 50): ") or "50")
                     await self.workflow_scrape_connections(max_profiles)
                 
                 elif choice == 3:
                     # Resume
-                    limit = int(input("How many profiles to resume (default 100): ") or "100")
+                    limit = int(await async_input("How many profiles to resume (default 100): ") or "100")
                     await self.workflow_resume(limit)
                 
                 elif choice == 4:
@@ -499,14 +605,30 @@ class LinkedInScraperApp:
         """Cleanup and shutdown"""
         logger.info("🛑 Shutting down...")
         
+        if self._cleanup_task:
+            # Let a queued or running cleanup pass finish; only the idle wait is cancelled
+            if not self._cleanup_idle.is_set() and not self._cleanup_task.done():
+                logger.info("Waiting for the running cleanup to finish...")
+                await self._cleanup_idle.wait()
+            self._cleanup_task.cancel()
+            try:
+                await self._cleanup_task
+            except asyncio.CancelledError:
+                pass
+        
         if self.browser_controller:
             await self.browser_controller.cleanup()
+        await shutdown_browser_pool()
+        
+        if self._val_pool:
+            self._val_pool.shutdown(wait=False, cancel_futures=True)
         
         if self.start_time:
             elapsed = datetime.now() - self.start_time
             logger.info(f"Total execution time: {elapsed}")
         
         logger.info("[OK] Shutdown completed")
+        shutdown_logging()
 
 
 async def main():
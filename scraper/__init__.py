@@ -6,11 +6,16 @@ Multi-agent architecture with anti-detection capabilities
 __version__ = "2.0.0"
 __author__ = "LinkedIn Scraper Team"
 
+from .browser_pool import BrowserPool, get_browser_pool
+from .proxy_pool import ProxyPool
 from .browser_controller import BrowserController
 from .data_extractor import DataExtractor
 from .human_behavior import HumanBehavior
 
 __all__ = [
+    "BrowserPool",
+    "get_browser_pool",
+    "ProxyPool",
     "BrowserController",
     "DataExtractor",
     "HumanBehavior",
@@ -0,0 +1,166 @@
+"""
+LinkedIn Voyager API Fast Path
+- Fetches profile JSON with the logged-in browser session (no page navigation)
+- Maps the response onto the DataExtractor profile_data shape
+- Returns None on any failure so callers fall back to the browser
+"""
+
+import re
+import calendar
+import time
+from typing import Dict, List, Optional, Any
+from playwright.async_api import BrowserContext
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+VOYAGER_BASE = 'https://www.linkedin.com/voyager/api'
+API_TIMEOUT_MS = 15000
+
+_PUBLIC_ID_RE = re.compile(r'linkedin\.com/in/([^/?#]+)', re.IGNORECASE)
+
+
+def public_id_from_url(profile_url: str) -> Optional[str]:
+    """Extract the public profile id (vanity name) from a /in/ URL"""
+    match = _PUBLIC_ID_RE.search(profile_url or '')
+    return match.group(1) if match else None
+
+
+async def _get_json(context: BrowserContext, path: str, csrf_token: str) -> Optional[Dict]:
+    """GET a Voyager endpoint with the context's cookies; None unless it answers 200 with JSON"""
+    response = await context.request.get(
+        f"{VOYAGER_BASE}{path}",
+        headers={'csrf-token': csrf_token, 'x-restli-protocol-version': '2.0.0'},
+        timeout=API_TIMEOUT_MS,
+    )
+    try:
+        if response.status != 200:
+            logger.debug(f"Voyager {path} answered HTTP {response.status}")
+            return None
+        return await response.json()
+    finally:
+        await response.dispose()
+
+
+def _format_date(date: Optional[Dict]) -> Optional[str]:
+    """{'month': 1, 'year': 2020} -> 'Jan 2020'"""
+    if not date or not date.get('year'):
+        return None
+    month = date.get('month')
+    return f"{calendar.month_abbr[month]} {date['year']}" if month else str(date['year'])
+
+
+def _format_period(time_period: Optional[Dict]) -> Optional[str]:
+    """Voyager timePeriod -> 'Jan 2020 - Present'"""
+    if not time_period:
+        return None
+    start = _format_date(time_period.get('startDate'))
+    end = _format_date(time_period.get('endDate')) or 'Present'
+    return f"{start} - {end}" if start else None
+
+
+def _compact(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop empty values so entries look like the text-parsed ones"""
+    return {key: value for key, value in entry.items() if value}
+
+
+def _elements(view: Dict, key: str) -> List[Dict]:
+    """Elements list of a profileView sub-view (empty if missing)"""
+    return (view.get(key) or {}).get('elements') or []
+
+
+def _contact_from_api(contact: Dict, profile_url: str) -> Dict[str, Any]:
+    """Map profileContactInfo onto the keys parse_contact_info produces"""
+    birth = contact.get('birthDateOn') or {}
+    birthday = f"{calendar.month_name[birth['month']]} {birth['day']}" if birth.get('month') and birth.get('day') else None
+    emails = [contact['emailAddress']] if contact.get('emailAddress') else []
+    phones = [p['number'] for p in contact.get('phoneNumbers') or [] if p.get('number')]
+    websites = [w['url'] for w in contact.get('websites') or [] if w.get('url')]
+    twitter = [t['name'] for t in contact.get('twitterHandles') or [] if t.get('name')]
+    return {
+        'emails': emails or ['N/A'],
+        'phones': phones or ['N/A'],
+        'linkedin_urls': [profile_url],
+        'websites': websites or ['N/A'],
+        'twitter': twitter or ['N/A'],
+        'birthday': [birthday] if birthday else ['N/A'],
+        'linkedin_url': profile_url,
+    }
+
+
+def profile_from_api(view: Dict, contact: Optional[Dict], profile_url: str) -> Dict[str, Any]:
+    """Build profile_data (without completeness) from profileView/profileContactInfo JSON"""
+    profile = view.get('profile') or {}
+    name = f"{profile.get('firstName', '')} {profile.get('lastName', '')}".strip()
+
+    profile_data = {
+        'profile_url': profile_url,
+        'scraped_at_ns': time.time_ns(),
+        'extraction_method': 'voyager-api',
+        'name': name or None,
+        'headline': profile.get('headline') or None,
+        'location': profile.get('locationName') or profile.get('geoLocationName') or None,
+        'about': profile.get('summary') or None,
+    }
+    if contact:
+        profile_data['contact_info'] = _contact_from_api(contact, profile_url)
+
+    profile_data['experience'] = [
+        _compact({
+            'title': p.get('title'),
+            'company': p.get('companyName'),
+            'duration': _format_period(p.get('timePeriod')),
+            'description': p.get('description'),
+        })
+        for p in _elements(view, 'positionView') if p.get('title')
+    ]
+    profile_data['education'] = [
+        _compact({
+            'school': e.get('schoolName'),
+            'degree': ', '.join(filter(None, (e.get('degreeName'), e.get('fieldOfStudy')))),
+            'duration': _format_period(e.get('timePeriod')),
+        })
+        for e in _elements(view, 'educationView') if e.get('schoolName')
+    ]
+    profile_data['skills'] = [s['name'] for s in _elements(view, 'skillView') if s.get('name')]
+    profile_data['certifications'] = [
+        _compact({
+            'name': c.get('name'),
+            'issuer': c.get('authority'),
+            'date': _format_period(c.get('timePeriod')),
+        })
+        for c in _elements(view, 'certificationView') if c.get('name')
+    ]
+    profile_data['projects'] = [
+        _compact({'name': p.get('title'), 'description': p.get('description')})
+        for p in _elements(view, 'projectView') if p.get('title')
+    ]
+    profile_data['languages'] = [lang['name'] for lang in _elements(view, 'languageView') if lang.get('name')]
+    profile_data['recommendations'] = []
+    return profile_data
+
+
+async def try_api_profile(context: BrowserContext, profile_url: str) -> Optional[Dict]:
+    """Fetch a profile through Voyager using the context's session; None if unavailable"""
+    public_id = public_id_from_url(profile_url)
+    if not public_id or context is None:
+        return None
+
+    try:
+        # Voyager wants the JSESSIONID value (without quotes) echoed as the CSRF token
+        cookies = await context.cookies('https://www.linkedin.com')
+        jsession = next((c['value'] for c in cookies if c['name'] == 'JSESSIONID'), None)
+        if not jsession:
+            return None
+        csrf_token = jsession.strip('"')
+
+        view = await _get_json(context, f"/identity/profiles/{public_id}/profileView", csrf_token)
+        if not view or not view.get('profile'):
+            return None
+        contact = await _get_json(context, f"/identity/profiles/{public_id}/profileContactInfo", csrf_token)
+
+        return profile_from_api(view, contact, profile_url)
+    except Exception as e:
+        logger.debug(f"Voyager fast path unavailable for {profile_url}: {e}")
+        return None
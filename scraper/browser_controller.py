@@ -10,58 +10,272 @@ Advanced Browser Controller with Anti-Detection & CAPTCHA Handling
 import asyncio
 import random
 import json
-from typing import Optional, List, Dict, Any
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Set, Iterable, Union, Tuple, Deque, NamedTuple
 from pathlib import Path
-from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+from urllib.parse import urlparse
+from playwright.async_api import Page, Browser, BrowserContext, Route, Frame
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from .browser_pool import BrowserPool, get_browser_pool, safe_close
+from .proxy_pool import ProxyPool
 import logging
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Parser for JSON strings returned from page.evaluate
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+class Persona(NamedTuple):
+    """One internally consistent browser fingerprint"""
+    user_agent: str
+    platform: str  # navigator.platform
+    timezone_id: str
+    locale: str
+    width: int
+    height: int
+    device_scale_factor: float
+    latitude: float  # rough location matching the timezone
+    longitude: float
+
+
+_UA_WIN = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{v}.0.0.0 Safari/537.36'
+_UA_MAC = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{v}.0.0.0 Safari/537.36'
+_UA_LINUX = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{v}.0.0.0 Safari/537.36'
+
+# Correlated fingerprints: OS, timezone, locale, screen and location agree with each other
+PERSONAS = (
+    Persona(_UA_WIN.format(v=120), 'Win32', 'America/New_York', 'en-US', 1920, 1080, 1, 40.71, -74.01),
+    Persona(_UA_WIN.format(v=119), 'Win32', 'America/Chicago', 'en-US', 1366, 768, 1, 41.88, -87.63),
+    Persona(_UA_MAC.format(v=120), 'MacIntel', 'America/Los_Angeles', 'en-US', 1440, 900, 2, 37.77, -122.42),
+    Persona(_UA_LINUX.format(v=120), 'Linux x86_64', 'America/New_York', 'en-US', 1920, 1080, 1, 40.71, -74.01),
+    Persona(_UA_WIN.format(v=120), 'Win32', 'Europe/London', 'en-GB', 1920, 1080, 1.25, 51.51, -0.13),
+    Persona(_UA_MAC.format(v=120), 'MacIntel', 'Europe/London', 'en-GB', 1440, 900, 2, 51.51, -0.13),
+    Persona(_UA_WIN.format(v=120), 'Win32', 'America/Toronto', 'en-CA', 1536, 864, 1.25, 43.65, -79.38),
+    Persona(_UA_MAC.format(v=119), 'MacIntel', 'Australia/Sydney', 'en-AU', 1440, 900, 2, -33.87, 151.21),
+    Persona(_UA_WIN.format(v=120), 'Win32', 'Pacific/Auckland', 'en-NZ', 1920, 1080, 1, -36.85, 174.76),
+)
+
+COLOR_SCHEMES = ('light', 'dark')
+
+# Dedicated generator for fingerprint picks
+_RNG = random.Random()
+
+
+def load_personas(extra: Optional[Iterable[Dict[str, Any]]] = None) -> Tuple[Persona, ...]:
+    """Built-in personas plus any valid ones from config (dicts with Persona fields)"""
+    personas = list(PERSONAS)
+    for entry in extra or ():
+        try:
+            personas.append(Persona(**entry))
+        except TypeError as e:
+            logger.warning(f"[WARN] Ignoring invalid persona in config: {e}")
+    return tuple(personas)
+
+
+@lru_cache(maxsize=128)
+def _persona_args(persona: Persona) -> Tuple[Tuple[str, Any], ...]:
+    """Immutable context-args template for one persona"""
+    return (
+        ('device_scale_factor', persona.device_scale_factor),
+        ('locale', persona.locale),
+        ('reduced_motion', 'reduce'),
+        ('timezone_id', persona.timezone_id),
+        ('user_agent', persona.user_agent),
+        ('viewport', (('width', persona.width), ('height', persona.height))),
+    )
+
+
+@lru_cache(maxsize=128)
+def _stealth_script(persona: Persona) -> str:
+    """Stealth init script with navigator overrides matching the persona"""
+    settings = json.dumps({
+        'platform': persona.platform,
+        'userAgent': persona.user_agent,
+        'languages': [persona.locale, persona.locale.split('-')[0]],
+    })
+    # IIFE keeps the persona out of the page's global scope
+    return f"(() => {{\n    const persona = {settings};\n{_STEALTH_JS}\n}})();"
+
+# Core anti-detection injections, registered once per context (wrapped by _stealth_script)
+_STEALTH_JS = """
+    // Remove automation indicators
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined,
+    });
+    
+    // Override plugins
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5],
+    });
+    
+    // Override languages and platform to match the persona
+    Object.defineProperty(navigator, 'languages', {
+        get: () => persona.languages,
+    });
+    Object.defineProperty(navigator, 'platform', {
+        get: () => persona.platform,
+    });
+    
+    // Client hints must agree with the user agent string
+    const chromeVersion = (persona.userAgent.match(/Chrome\/(\d+)/) || [])[1] || '120';
+    const uaPlatform = {Win32: 'Windows', MacIntel: 'macOS'}[persona.platform] || 'Linux';
+    const brands = [
+        {brand: 'Not_A Brand', version: '8'},
+        {brand: 'Chromium', version: chromeVersion},
+        {brand: 'Google Chrome', version: chromeVersion},
+    ];
+    const userAgentData = {
+        brands,
+        mobile: false,
+        platform: uaPlatform,
+        getHighEntropyValues: async () => ({
+            brands, mobile: false, platform: uaPlatform, uaFullVersion: `${chromeVersion}.0.0.0`,
+        }),
+        toJSON: () => ({brands, mobile: false, platform: uaPlatform}),
+    };
+    Object.defineProperty(navigator, 'userAgentData', {
+        get: () => userAgentData,
+    });
+    
+    // Mock chrome runtime
+    window.chrome = {
+        runtime: {},
+        loadTimes: function() {},
+        csi: function() {},
+    };
+    
+    // Override permissions
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+            Promise.resolve({ state: Notification.permission }) :
+            originalQuery(parameters)
+    );
+    
+    // Remove headless indicator
+    Object.defineProperty(navigator, 'vendor', {
+        get: () => 'Google Inc.',
+    });
+    
+    // Randomize canvas fingerprint
+    const canvas = document.createElement('canvas');
+    const ctx = canvas.getContext('2d');
+    const text = 'Browser Canvas';
+    ctx.textBaseline = 'top';
+    ctx.font = '14px Arial';
+    ctx.textBaseline = 'alphabetic';
+    ctx.fillStyle = '#f60';
+    ctx.fillRect(125, 1, 62, 20);
+    ctx.fillStyle = '#069';
+    ctx.fillText(text, 2, 15);
+    ctx.fillStyle = 'rgba(102, 204, 0, 0.7)';
+    ctx.fillText(text, 4, 17);
+    
+    // Override toString
+    const originalToString = canvas.toDataURL.toString;
+    canvas.toDataURL.toString = function() {
+        return originalToString.call(this);
+    };
+"""
+
+# Where navigation-failure screenshots are written (created in initialize)
+SCREENSHOT_DIR = Path('logs')
+
+# Request types the scraper never inspects; aborting them cuts page weight
+DEFAULT_BLOCKED_RESOURCES = frozenset({'image', 'font', 'media'})
+
+# Phrases in visible page text that indicate LinkedIn is blocking us
+BLOCK_SIGNALS = ['access denied', 'unusual traffic', 'verify you are human', 'we suspect unusual activity']
+
+# HTTP statuses LinkedIn/Cloudflare answer with when refusing a request
+BLOCK_STATUSES = frozenset({403, 429, 503})
+MAX_RETRY_AFTER = 60
+
+# Per-host politeness: minimum gap between navigations, doubled on 429/blocks up to the cap
+HOST_BASE_INTERVAL = 1.0
+HOST_MAX_INTERVAL = 120.0
+
+# Spare pages kept open on the shared context for acquire_page()
+MAX_IDLE_PAGES = 4
+
+# Selectors confirming a CAPTCHA widget is present
+CAPTCHA_SELECTOR = 'iframe[src*="recaptcha"], iframe[src*="hcaptcha"], div.g-recaptcha, [data-captcha]'
+
+# Manual CAPTCHA solving: overall wait and how often to re-probe the page
+CAPTCHA_TIMEOUT_MS = 600000
+CAPTCHA_POLL_INTERVAL = 2
+
+# Page probe: returns {captcha, blocked} instead of shipping the whole DOM over CDP
+_PROBE_JS = """
+    ([captchaSelector, blockSignals]) => {
+        const captcha = document.querySelector(captchaSelector) !== null;
+        const text = (document.body ? document.body.innerText : '').slice(0, 4096).toLowerCase();
+        const blocked = blockSignals.some(sig => text.includes(sig));
+        return {captcha, blocked};
+    }
+"""
+
 
 class BrowserController:
     """Advanced browser management with anti-detection"""
     
-    # Realistic user agents for fingerprinting
-    USER_AGENTS = [
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-    ]
-    
-    TIMEZONES = [
-        'America/New_York', 'America/Chicago', 'America/Los_Angeles',
-        'Europe/London', 'Europe/Paris', 'Asia/Tokyo', 'Australia/Sydney'
-    ]
-    
-    LOCALES = [
-        'en-US', 'en-GB', 'en-CA', 'en-AU', 'en-NZ'
-    ]
-    
-    SCREEN_RESOLUTIONS = [
-        {'width': 1920, 'height': 1080},
-        {'width': 1366, 'height': 768},
-        {'width': 1440, 'height': 900},
-        {'width': 2560, 'height': 1440},
-    ]
-    
-    def __init__(self, headless: bool = False, use_proxy: Optional[str] = None, use_stealth: bool = True):
+    def __init__(self, headless: bool = False, use_proxy: Union[str, List[str], None] = None, use_stealth: bool = True,
+                 pool: Optional[BrowserPool] = None, block_resources: Optional[Iterable[str]] = None,
+                 personas: Optional[Iterable[Dict[str, Any]]] = None):
         """
         Initialize browser controller
         
         Args:
             headless: Run in headless mode
-            use_proxy: Proxy server URL (e.g., http://proxy:8080)
+            use_proxy: Proxy server URL (e.g., http://proxy:8080) or a list to rotate between
             use_stealth: Enable stealth mode
+            pool: Browser pool to take a context from (defaults to the shared pool)
+            block_resources: Request resource types to abort (e.g. image, font, media, stylesheet)
+            personas: Extra fingerprint personas (dicts with Persona fields) added to the built-in ones
         """
         self.headless = headless
         self.use_proxy = use_proxy
+        self.proxy_pool = ProxyPool.from_setting(use_proxy)
+        self.current_proxy: Optional[str] = None
         self.use_stealth = use_stealth
+        self.pool = pool
+        self.block_resources: Set[str] = (
+            set(block_resources) if block_resources is not None else set(DEFAULT_BLOCKED_RESOURCES)
+        )
+        
+        self.personas = load_personas(personas)
+        self.persona: Optional[Persona] = None
+        # Fingerprint args chosen with the persona, kept across proxy rotations
+        self._fingerprint_args: Optional[Dict[str, Any]] = None
         
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
-        self._playwright = None
+        
+        # Extra pages on the same context (shared cache/cookies) for per-task fetches
+        self._idle_pages: Deque[Page] = deque()
+        
+        # Scripts registered by other components, re-applied to every new context
+        self._init_scripts: List[str] = []
+        
+        # page.content() memo: (url, html) plus the in-flight fetch shared by concurrent callers
+        self._content_cache: Optional[Tuple[str, str]] = None
+        self._content_fetch: Optional[asyncio.Future] = None
+        
+        # Politeness table: host -> current interval and earliest monotonic time for the next request
+        self._host_interval: Dict[str, float] = {}
+        self._host_next_ok: Dict[str, float] = {}
+        
+        # Debug screenshot file writes run in the background
+        self._background_tasks: Set[asyncio.Task] = set()
         
         # Session tracking
         self.cookies: List[Dict] = []
@@ -71,46 +285,13 @@ class BrowserController:
         """Initialize and launch browser with stealth"""
         try:
             logger.info("Initializing browser controller...")
+            SCREENSHOT_DIR.mkdir(exist_ok=True)
             
-            self._playwright = await async_playwright().start()
-            
-            # Browser launch arguments for anti-detection
-            launch_args = [
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--no-sandbox',
-                '--disable-web-security',
-                '--disable-features=IsolateOrigins,site-per-process',
-                '--disable-site-isolation-trials',
-                '--disable-background-timer-throttling',
-                '--disable-backgrounding-occluded-windows',
-                '--disable-ipc-flooding-protection',
-                '--disable-popup-blocking',
-                '--disable-extensions',
-                '--disable-default-apps',
-                '--disable-sync',
-                '--disable-translate',
-                '--disable-client-side-phishing-detection',
-                '--disable-component-extensions-with-background-pages',
-            ]
-            
-            # Launch browser
-            self.browser = await self._playwright.chromium.launch(
-                headless=self.headless,
-                args=launch_args,
-                ignore_default_args=['--enable-automation', '--disable-background-timer-throttling']
-            )
-            
-            # Create context with realistic fingerprint
-            context_args = await self._get_context_args()
-            self.context = await self.browser.new_context(**context_args)
-            
-            # Create page
-            self.page = await self.context.new_page()
+            # Reuse the shared browser; only the context is per controller
+            if self.pool is None:
+                self.pool = get_browser_pool(headless=self.headless)
             
-            # Apply stealth techniques
-            if self.use_stealth:
-                await self._apply_stealth()
+            await self._open_context()
             
             logger.info("Browser initialized successfully")
             return True
@@ -120,95 +301,176 @@ class BrowserController:
             await self.cleanup()
             return False
     
+    async def _open_context(self):
+        """Acquire a fresh fingerprinted context from the pool and open a page in it"""
+        # Create context with realistic fingerprint
+        context_args = await self._get_context_args()
+        self.context = await self.pool.acquire_context(**context_args)
+        self.browser = self.pool.browser
+        
+        # Drop heavy resources the text extraction never looks at
+        if self.block_resources:
+            await self.context.route("**/*", self._filter_route)
+        
+        # Apply stealth techniques (context-wide, so every page gets them)
+        if self.use_stealth:
+            await self._apply_stealth()
+        
+        for script in self._init_scripts:
+            await self.context.add_init_script(script)
+        
+        # Create page
+        self.page = await self.context.new_page()
+        self._invalidate_content_cache()
+        self.page.on("framenavigated", self._on_frame_navigated)
+    
+    async def acquire_page(self) -> Page:
+        """Get a page on the shared context, reusing an idle one when available"""
+        if self.context is None and not await self.initialize():
+            raise RuntimeError("Browser initialization failed; no context to open pages on")
+        
+        while self._idle_pages:
+            page = self._idle_pages.pop()
+            if not page.is_closed():
+                return page
+        return await self.context.new_page()
+    
+    async def release_page(self, page: Page):
+        """Return a page from acquire_page, parking it on about:blank for the next task"""
+        if page is None or page.is_closed():
+            return
+        
+        if page.context is self.context and len(self._idle_pages) < MAX_IDLE_PAGES:
+            try:
+                await page.goto('about:blank')
+                self._idle_pages.append(page)
+                return
+            except Exception as e:
+                logger.debug(f"Page reset note: {e}")
+        await safe_close(page, "Page")
+    
+    def _on_frame_navigated(self, frame: Frame):
+        """Drop cached HTML when the main frame navigates"""
+        if self.page and frame == self.page.main_frame:
+            self._invalidate_content_cache()
+    
+    def _invalidate_content_cache(self):
+        """Forget cached page HTML (call after in-page DOM changes that matter)"""
+        self._content_cache = None
+        self._content_fetch = None
+    
+    async def _cached_content(self) -> str:
+        """page.content() shared by all callers until the page navigates"""
+        url = self.page.url
+        if self._content_cache and self._content_cache[0] == url:
+            return self._content_cache[1]
+        
+        # Single flight: concurrent callers await the same CDP serialization
+        if self._content_fetch is None:
+            self._content_fetch = asyncio.ensure_future(self.page.content())
+        fetch = self._content_fetch
+        try:
+            html = await asyncio.shield(fetch)
+        except Exception:
+            if self._content_fetch is fetch:
+                self._content_fetch = None
+            raise
+        
+        # Only cache if the page did not navigate while we were fetching
+        if self._content_fetch is fetch:
+            self._content_cache = (url, html)
+            self._content_fetch = None
+        return html
+    
+    async def _rotate_proxy(self) -> bool:
+        """Penalize the current proxy and move the session to a new context/proxy"""
+        if not self.proxy_pool:
+            return False
+        
+        self.proxy_pool.penalize(self.current_proxy)
+        if len(self.proxy_pool) < 2:
+            return False
+        
+        try:
+            # Carry the login session over to the new context
+            cookies = await self.context.cookies()
+            try:
+                await self.page.close()
+            except Exception:
+                pass
+            # Idle pages belong to the old context and close with it
+            self._idle_pages.clear()
+            await self.pool.release(self.context)
+            
+            await self._open_context()
+            if cookies:
+                await self.context.add_cookies(cookies)
+            
+            logger.info(f"[INFO] Rotated to proxy {self.current_proxy}")
+            return True
+        except Exception as e:
+            logger.error(f"[X] Proxy rotation failed: {e}")
+            return False
+    
+    async def _filter_route(self, route: Route):
+        """Abort requests for blocked resource types, let everything else through"""
+        try:
+            if route.request.resource_type in self.block_resources:
+                await route.abort()
+            else:
+                await route.continue_()
+        except Exception as e:
+            logger.debug(f"Route filter note: {e}")
+    
     async def _get_context_args(self) -> Dict[str, Any]:
         """Generate realistic context arguments"""
-        resolution = random.choice(self.SCREEN_RESOLUTIONS)
+        # One correlated persona per session; only the colour scheme varies independently.
+        # Proxy rotations reuse it so the fingerprint does not change mid-session.
+        if self.persona is None or self._fingerprint_args is None:
+            self.persona = _RNG.choice(self.personas)
+            fingerprint = dict(_persona_args(self.persona))
+            fingerprint['color_scheme'] = _RNG.choice(COLOR_SCHEMES)
+            fingerprint['permissions'] = ['geolocation']
+            fingerprint['geolocation'] = {
+                'latitude': self.persona.latitude + _RNG.uniform(-0.05, 0.05),
+                'longitude': self.persona.longitude + _RNG.uniform(-0.05, 0.05),
+            }
+            self._fingerprint_args = fingerprint
         
-        context_args = {
-            'viewport': resolution,
-            'user_agent': random.choice(self.USER_AGENTS),
-            'locale': random.choice(self.LOCALES),
-            'timezone_id': random.choice(self.TIMEZONES),
-            'permissions': ['geolocation'],
-            'geolocation': {'latitude': random.uniform(-90, 90), 'longitude': random.uniform(-180, 180)},
-            'color_scheme': random.choice(['light', 'dark']),
-            'reduced_motion': 'reduce',
-            'device_scale_factor': random.choice([1, 1.25, 1.5, 2]),
-        }
+        # Copy the cached args; mutable values are rebuilt per context
+        context_args = dict(self._fingerprint_args)
+        context_args['viewport'] = dict(context_args['viewport'])
+        context_args['permissions'] = list(context_args['permissions'])
+        context_args['geolocation'] = dict(context_args['geolocation'])
         
-        # Add proxy if provided
-        if self.use_proxy:
-            context_args['proxy'] = {'server': self.use_proxy}
+        # Add proxy if provided (best-scoring proxies are picked most often)
+        if self.proxy_pool:
+            self.current_proxy = self.proxy_pool.pick()
+            context_args['proxy'] = {'server': self.current_proxy}
         
         return context_args
     
+    async def add_init_script(self, script: str):
+        """Run a script in every page of this controller, including contexts opened by proxy rotation"""
+        if script in self._init_scripts:
+            return
+        self._init_scripts.append(script)
+        if self.context is not None:
+            await self.context.add_init_script(script)
+    
     async def _apply_stealth(self):
-        """Apply advanced stealth techniques"""
+        """Apply advanced stealth techniques to the whole context"""
         try:
             # Additional stealth injections (core anti-detection)
-            await self.page.add_init_script("""
-                // Remove automation indicators
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined,
-                });
-                
-                // Override plugins
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5],
-                });
-                
-                // Override languages
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en'],
-                });
-                
-                // Mock chrome runtime
-                window.chrome = {
-                    runtime: {},
-                    loadTimes: function() {},
-                    csi: function() {},
-                };
-                
-                // Override permissions
-                const originalQuery = window.navigator.permissions.query;
-                window.navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications' ?
-                        Promise.resolve({ state: Notification.permission }) :
-                        originalQuery(parameters)
-                );
-                
-                // Remove headless indicator
-                Object.defineProperty(navigator, 'vendor', {
-                    get: () => 'Google Inc.',
-                });
-                
-                // Randomize canvas fingerprint
-                const canvas = document.createElement('canvas');
-                const ctx = canvas.getContext('2d');
-                const text = 'Browser Canvas';
-                ctx.textBaseline = 'top';
-                ctx.font = '14px Arial';
-                ctx.textBaseline = 'alphabetic';
-                ctx.fillStyle = '#f60';
-                ctx.fillRect(125, 1, 62, 20);
-                ctx.fillStyle = '#069';
-                ctx.fillText(text, 2, 15);
-                ctx.fillStyle = 'rgba(102, 204, 0, 0.7)';
-                ctx.fillText(text, 4, 17);
-                
-                // Override toString
-                const originalToString = canvas.toDataURL.toString;
-                canvas.toDataURL.toString = function() {
-                    return originalToString.call(this);
-                };
-            """)
+            await self.context.add_init_script(_stealth_script(self.persona))
             
             logger.info("Stealth mode applied (JavaScript injections)")
             
         except Exception as e:
             logger.debug(f"Stealth application note: {e}")  # Changed to debug to avoid warning
     
-    async def navigate(self, url: str, wait_until: str = 'networkidle', timeout: int = 30000, max_retries: int = 3) -> bool:
+    async def navigate(self, url: str, wait_until: str = 'domcontentloaded', timeout: int = 30000, max_retries: int = 3,
+                       wait_for: Optional[str] = None) -> bool:
         """Navigate with retry/backoff and improved error handling.
 
         Args:
@@ -216,112 +478,169 @@ class BrowserController:
             wait_until: Playwright wait strategy
             timeout: initial timeout in ms
             max_retries: number of retry attempts on timeout
+            wait_for: optional selector to wait for after the DOM is ready
         """
-        # Add short random delay before navigation to appear human-like
-        await asyncio.sleep(random.uniform(0.5, 2))
-
+        host = urlparse(url).hostname or ''
+        
         attempt = 0
         current_timeout = timeout
         while attempt < max_retries:
             attempt += 1
+            await self._wait_host_turn(host)
             try:
                 logger.debug(f"Navigating to {url} (attempt {attempt}/{max_retries}, timeout={current_timeout})")
-                await self.page.goto(url, wait_until=wait_until, timeout=current_timeout)
+                response = await self.page.goto(url, wait_until=wait_until, timeout=current_timeout)
+                status = response.status if response else None
+
+                # Rate limited - back off on another proxy instead of treating it as a hard block
+                if status == 429:
+                    logger.warning(f"[WARN] Rate limited (HTTP 429) on {url}")
+                    self._host_backoff(host)
+                    if attempt < max_retries:
+                        await asyncio.sleep(self._retry_after(response))
+                        await self._rotate_proxy()  # penalizes the current proxy
+                        continue
+                    # Last attempt: no rotation, so penalize here (once, like any other block)
+                    if self.proxy_pool:
+                        self.proxy_pool.penalize(self.current_proxy)
+                    return False
+                
+                # Wait for the element the caller needs instead of full network idle
+                if wait_for:
+                    await self.page.wait_for_selector(wait_for, timeout=current_timeout)
 
                 # small delay to let dynamic content load
                 await asyncio.sleep(random.uniform(0.2, 0.8))
 
+                # One small probe answers both the CAPTCHA and the block check
+                probe = await self._probe_page()
+                
                 # Detect CAPTCHA or blocks
-                if await self._detect_captcha():
+                if probe['captcha']:
                     logger.warning("[PUZZLE] CAPTCHA detected during navigation")
                     captcha_handled = await self._handle_captcha()
                     if not captcha_handled:
                         return False
                     # Continue with page check after CAPTCHA handling
                     await asyncio.sleep(1)
-
-                # Optionally detect common block phrases
-                content = ''
-                try:
-                    content = await self.page.content()
-                except Exception:
-                    content = ''
-
-                blocked_signals = ['access denied', 'unusual traffic', 'verify you are human', 'we suspect unusual activity']
+                    probe = await self._probe_page()
                 
-                # Only return False if strong block signals are present
-                has_block_signal = any(sig in content.lower() for sig in blocked_signals)
+                # The response status is free; the text probe covers 200 pages with a block notice
+                status_blocked = response is not None and (
+                    status in BLOCK_STATUSES or 'cf-mitigated' in response.headers
+                )
+                has_block_signal = status_blocked or probe['blocked']
                 
                 if has_block_signal:
-                    logger.warning(f"[WARN] Navigation may be blocked for {url}")
+                    logger.warning(f"[WARN] Navigation may be blocked for {url} (HTTP {status})")
+                    self._host_backoff(host)
                     # Try remediation with longer delays
                     try:
                         logger.info("[INFO] Attempting remediation: longer delay and reload")
                         await asyncio.sleep(random.uniform(3, 6))  # Longer delay
-                        await self.page.reload(timeout=12000)
+                        reloaded = await self.page.reload(timeout=12000)
                         await asyncio.sleep(random.uniform(2, 4))
-                        content2 = await self.page.content()
-                        if not any(sig in content2.lower() for sig in blocked_signals):
+                        if reloaded and reloaded.status in BLOCK_STATUSES:
+                            raise RuntimeError(f"still blocked (HTTP {reloaded.status})")
+                        if not (await self._probe_page())['blocked']:
                             logger.info("[OK] Remediation succeeded after reload")
                             return True
                     except Exception:
                         pass
                     
+                    # Same IP is still blocked - retry through another proxy if we have one
+                    if attempt < max_retries and await self._rotate_proxy():
+                        continue
                     return False
                 
                 # If no strong block signals, continue (may be a false warning)
 
+                self._host_ok(host)
+                if self.proxy_pool:
+                    self.proxy_pool.reward(self.current_proxy)
                 logger.info(f"[OK] Navigated to {url}")
                 return True
 
-            except asyncio.TimeoutError:
+            except (asyncio.TimeoutError, PlaywrightTimeoutError):
                 logger.warning(f"[TIME] Navigation timeout for {url} on attempt {attempt}")
+                if attempt < max_retries:
+                    await self._rotate_proxy()
                 # increase timeout and retry with jitter
                 current_timeout = int(current_timeout * 1.8) + random.randint(2000, 5000)
                 await asyncio.sleep(random.uniform(1, 3))
                 continue
             except Exception as e:
                 logger.error(f"[X] Navigation failed: {e}")
-                # capture screenshot for debugging when possible
-                try:
-                    screenshot_path = Path('logs') / f"nav_error_{int(asyncio.get_event_loop().time())}.png"
-                    await self.page.screenshot(path=str(screenshot_path))
-                    logger.info(f"[OK] Saved screenshot: {screenshot_path}")
-                except Exception:
-                    pass
+                # capture screenshot for debugging (the file is written in the background)
+                await self._save_debug_screenshot(url)
                 return False
 
         logger.error(f"[X] Navigation failed after {max_retries} attempts: {url}")
         return False
     
+    def _run_in_background(self, coro):
+        """Fire and forget, keeping a reference so the task is not garbage collected"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    async def _wait_host_turn(self, host: str):
+        """Sleep until the host's politeness interval has passed (no wait for a fresh host)"""
+        delay = self._host_next_ok.get(host, 0.0) - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    def _host_ok(self, host: str):
+        """Schedule the next request to a host that answered normally, easing its interval"""
+        interval = max(HOST_BASE_INTERVAL, self._host_interval.get(host, HOST_BASE_INTERVAL) * 0.75)
+        self._host_interval[host] = interval
+        self._host_next_ok[host] = time.monotonic() + interval * random.uniform(1.0, 1.5)
+    
+    def _host_backoff(self, host: str):
+        """Double a host's interval after a 429 or block"""
+        interval = min(HOST_MAX_INTERVAL, self._host_interval.get(host, HOST_BASE_INTERVAL) * 2)
+        self._host_interval[host] = interval
+        self._host_next_ok[host] = time.monotonic() + interval
+        logger.debug(f"Backing off {host}: {interval:.1f}s between requests")
+    
+    @staticmethod
+    def _retry_after(response) -> float:
+        """Seconds to wait after a 429, honouring a numeric Retry-After header"""
+        value = response.headers.get('retry-after', '')
+        if value.isdigit():
+            return min(MAX_RETRY_AFTER, int(value))
+        return random.uniform(10, 20)
+    
+    async def _save_debug_screenshot(self, url: str):
+        """Save a viewport JPEG of the current page for debugging a failed navigation"""
+        # Capture now, while the page still shows the failure - the caller may navigate
+        # elsewhere as soon as navigate() returns. Only the disk write is deferred.
+        try:
+            image = await self.page.screenshot(type='jpeg', quality=60, full_page=False)
+        except Exception:
+            return
+        screenshot_path = SCREENSHOT_DIR / f"nav_error_{time.monotonic_ns()}.jpg"
+        self._run_in_background(self._write_screenshot(screenshot_path, image, url))
+    
+    async def _write_screenshot(self, screenshot_path: Path, image: bytes, url: str):
+        """Write captured screenshot bytes to disk off the event loop"""
+        try:
+            await asyncio.to_thread(screenshot_path.write_bytes, image)
+            logger.info(f"[OK] Saved screenshot for {url}: {screenshot_path}")
+        except Exception:
+            pass
+    
+    async def _probe_page(self) -> Dict[str, bool]:
+        """Check for a CAPTCHA widget and block phrases without fetching the full HTML"""
+        try:
+            return await self.page.evaluate(_PROBE_JS, [CAPTCHA_SELECTOR, BLOCK_SIGNALS])
+        except Exception as e:
+            logger.debug(f"Page probe note: {e}")
+            return {'captcha': False, 'blocked': False}
+    
     async def _detect_captcha(self) -> bool:
         """Detect various CAPTCHA types - more strict detection"""
-        try:
-            page_content = await self.page.content()
-            # Only return True if explicit CAPTCHA indicators are found
-            captcha_indicators = [
-                'recaptcha',
-                'hcaptcha',
-                'captcha',
-                'challenge-form',
-                'verify-you-are-human',
-            ]
-            
-            for indicator in captcha_indicators:
-                if indicator.lower() in page_content.lower():
-                    # Double-check with selector
-                    captcha_selectors = [
-                        'iframe[src*="recaptcha"]',
-                        'iframe[src*="hcaptcha"]',
-                        'div.g-recaptcha',
-                        '[data-captcha]',
-                    ]
-                    for selector in captcha_selectors:
-                        if await self.page.query_selector(selector):
-                            return True
-            return False
-        except:
-            return False
+        return (await self._probe_page())['captcha']
     
     async def _handle_captcha(self) -> bool:
         """Handle CAPTCHA with manual intervention - improved timeout handling"""
@@ -333,33 +652,43 @@ class BrowserController:
         print("The script will wait for 10 minutes...")
         print("="*60 + "\n")
         
+        # Whichever comes first: the page navigates away or the widget disappears in place
+        nav_task = asyncio.create_task(self._wait_for_navigation(CAPTCHA_TIMEOUT_MS))
+        probe_task = asyncio.create_task(self._wait_captcha_cleared())
         try:
-            # Wait for user to solve CAPTCHA with extended timeout
-            await asyncio.sleep(2)  # Give user time to start solving
-            
-            # Check if page navigated
-            start_url = self.page.url
+            done, _ = await asyncio.wait(
+                {nav_task, probe_task}, timeout=CAPTCHA_TIMEOUT_MS / 1000, return_when=asyncio.FIRST_COMPLETED
+            )
             
-            # Wait for navigation or timeout
-            try:
-                await self.page.wait_for_navigation(timeout=600000)  # 10 minutes
+            if nav_task in done and not nav_task.exception():
                 logger.info("CAPTCHA solved by user (page navigated)")
                 return True
-            except:
-                # Check if page content changed (even without navigation)
-                try:
-                    current_content = await self.page.content()
-                    if 'verify' not in current_content.lower() and 'captcha' not in current_content.lower():
-                        logger.info("CAPTCHA appears to be solved (content changed)")
-                        return True
-                except:
-                    pass
-                
-                logger.error("❌ CAPTCHA timeout or failed to solve")
-                return False
+            if probe_task in done and not probe_task.exception():
+                logger.info("CAPTCHA appears to be solved (content changed)")
+                return True
+            
+            logger.error("❌ CAPTCHA timeout or failed to solve")
+            return False
         except Exception as e:
             logger.error(f"Error handling CAPTCHA: {e}")
             return False
+        finally:
+            for task in (nav_task, probe_task):
+                task.cancel()
+            await asyncio.gather(nav_task, probe_task, return_exceptions=True)
+    
+    async def _wait_for_navigation(self, timeout: int):
+        """Resolve when the main frame navigates"""
+        async with self.page.expect_navigation(timeout=timeout):
+            pass
+    
+    async def _wait_captcha_cleared(self):
+        """Poll the cheap probe until neither a CAPTCHA nor a block notice is showing"""
+        while True:
+            await asyncio.sleep(CAPTCHA_POLL_INTERVAL)
+            probe = await self._probe_page()
+            if not probe['captcha'] and not probe['blocked']:
+                return
     
     async def get_cookies(self) -> List[Dict]:
         """Get all cookies from current context"""
@@ -380,9 +709,9 @@ class BrowserController:
             logger.error(f"Error setting cookies: {e}")
     
     async def get_page_content(self) -> str:
-        """Get full HTML content"""
+        """Get full HTML content (cached until the page navigates)"""
         try:
-            return await self.page.content()
+            return await self._cached_content()
         except Exception as e:
             logger.error(f"Error getting page content: {e}")
             return ""
@@ -390,66 +719,53 @@ class BrowserController:
     async def extract_text_sections(self) -> Dict[str, str]:
         """Extract all text content organized by sections"""
         try:
-            sections = await self.page.evaluate("""
+            # Ship one JSON string over CDP and parse it in a single pass
+            payload = await self.page.evaluate("""
                 () => {
                     const result = {};
+                    let sectionIdx = 0;
+                    let listIdx = 0;
                     
-                    // Get all sections
-                    const sections_elements = document.querySelectorAll('section');
-                    sections_elements.forEach((section, idx) => {
-                        const header = section.querySelector('h2, h3, [class*="heading"]');
-                        const key = header ? header.innerText : `section_${idx}`;
-                        result[key] = section.innerText;
-                    });
+                    // One document-order walk over sections and lists.
+                    // textContent does not force a layout flush the way innerText does.
+                    for (const el of document.querySelectorAll('section, ul, ol')) {
+                        if (el.tagName === 'SECTION') {
+                            const header = el.querySelector('h2, h3, [class*="heading"]');
+                            const key = header ? header.textContent.trim() : `section_${sectionIdx}`;
+                            result[key] = el.textContent.trim();
+                            sectionIdx++;
+                        } else {
+                            result[`list_${listIdx}`] = Array.from(
+                                el.children, li => li.textContent.trim()
+                            ).join('\\n');
+                            listIdx++;
+                        }
+                    }
                     
-                    // Get all lists
-                    const lists = document.querySelectorAll('ul, ol');
-                    lists.forEach((list, idx) => {
-                        const items = [];
-                        list.querySelectorAll('li').forEach(li => {
-                            items.push(li.innerText);
-                        });
-                        result[`list_${idx}`] = items.join('\\n');
-                    });
-                    
-                    return result;
+                    return JSON.stringify(result);
                 }
             """)
-            return sections
+            return _json_loads(payload)
         except Exception as e:
             logger.error(f"Error extracting text sections: {e}")
             return {}
     
     async def cleanup(self):
-        """Clean up resources with proper error handling"""
+        """Clean up resources with proper error handling (the shared browser stays up)"""
         try:
-            # Close page safely
+            # Close page and return context to the pool concurrently (independent round-trips)
+            steps = []
             if self.page:
-                try:
-                    await self.page.close()
-                except (asyncio.CancelledError, Exception) as e:
-                    logger.debug(f"Page close note: {type(e).__name__}")
-            
-            # Close context safely
-            if self.context:
-                try:
-                    await self.context.close()
-                except (asyncio.CancelledError, Exception) as e:
-                    logger.debug(f"Context close note: {type(e).__name__}")
-            
-            # Close browser safely
-            if self.browser:
-                try:
-                    await self.browser.close()
-                except (asyncio.CancelledError, Exception) as e:
-                    logger.debug(f"Browser close note: {type(e).__name__}")
+                steps.append(safe_close(self.page, "Page"))
+            steps.extend(safe_close(p, "Page") for p in self._idle_pages)
+            self._idle_pages.clear()
+            if self.context and self.pool:
+                steps.append(self.pool.release(self.context))
+            await asyncio.gather(*steps, return_exceptions=True)
             
-            # Stop playwright safely
-            if self._playwright:
-                try:
-                    await self._playwright.stop()
-                except (asyncio.CancelledError, Exception) as e:
-                    logger.debug(f"Playwright stop note: {type(e).__name__}")
+            self.page = None
+            self.context = None
+            self.browser = None
             
             logger.info("Browser cleanup completed")
         except Exception as e:
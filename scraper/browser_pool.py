@@ -0,0 +1,156 @@
+"""
+Shared Browser Pool
+- One Playwright driver and one Chromium process per interpreter
+- Isolated BrowserContext per task
+- Concurrency limit on open contexts
+- Deduplicated launch (concurrent callers share the first launch)
+"""
+
+import asyncio
+from typing import Optional, Set
+from playwright.async_api import async_playwright, Browser, BrowserContext
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Browser launch arguments for anti-detection
+LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-web-security',
+    '--disable-features=IsolateOrigins,site-per-process',
+    '--disable-site-isolation-trials',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-ipc-flooding-protection',
+    '--disable-popup-blocking',
+    '--disable-extensions',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--disable-translate',
+    '--disable-client-side-phishing-detection',
+    '--disable-component-extensions-with-background-pages',
+]
+
+IGNORE_DEFAULT_ARGS = ['--enable-automation', '--disable-background-timer-throttling']
+
+
+async def safe_close(resource, label: str):
+    """Close a Playwright page/context/browser, logging instead of raising"""
+    try:
+        await resource.close()
+    except (asyncio.CancelledError, Exception) as e:
+        logger.debug(f"{label} close note: {type(e).__name__}")
+
+
+class BrowserPool:
+    """Own a single launched browser and hand out contexts to tasks"""
+
+    def __init__(self, headless: bool = False, max_concurrent: int = 4):
+        """
+        Initialize browser pool
+
+        Args:
+            headless: Run in headless mode
+            max_concurrent: Maximum number of contexts open at once
+        """
+        self.headless = headless
+        self.max_concurrent = max_concurrent
+
+        self.browser: Optional[Browser] = None
+        self._playwright = None
+        self._launch_future: Optional[asyncio.Future] = None
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._contexts: Set[BrowserContext] = set()
+
+    async def _launch(self) -> Browser:
+        """Start Playwright and launch Chromium"""
+        logger.info("Launching shared browser...")
+        self._playwright = await async_playwright().start()
+        self.browser = await self._playwright.chromium.launch(
+            headless=self.headless,
+            args=LAUNCH_ARGS,
+            ignore_default_args=IGNORE_DEFAULT_ARGS
+        )
+        logger.info("Shared browser launched")
+        return self.browser
+
+    async def _get_browser(self) -> Browser:
+        """Return the shared browser, launching it once for all concurrent callers"""
+        if self.browser and not self.browser.is_connected():
+            # Browser crashed or was closed externally - allow a fresh launch
+            await self.close()
+
+        if self._launch_future is None:
+            self._launch_future = asyncio.ensure_future(self._launch())
+
+        try:
+            return await asyncio.shield(self._launch_future)
+        except Exception:
+            # Reset so the next caller can retry the launch
+            await self.close()
+            raise
+
+    async def acquire_context(self, **context_args) -> BrowserContext:
+        """Open a new context on the shared browser (waits if the pool is full)"""
+        await self._semaphore.acquire()
+        try:
+            browser = await self._get_browser()
+            context = await browser.new_context(**context_args)
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+        self._contexts.add(context)
+        return context
+
+    async def release(self, context: BrowserContext):
+        """Close a context obtained from acquire_context and free its slot"""
+        if context not in self._contexts:
+            return
+
+        self._contexts.discard(context)
+        try:
+            await safe_close(context, "Context")
+        finally:
+            self._semaphore.release()
+
+    async def close(self):
+        """Close all contexts, the browser and the Playwright driver"""
+        # Contexts are independent - close them all at once, then the browser
+        await asyncio.gather(*(self.release(c) for c in list(self._contexts)), return_exceptions=True)
+
+        if self.browser:
+            await safe_close(self.browser, "Browser")
+
+        if self._playwright:
+            try:
+                await self._playwright.stop()
+            except (asyncio.CancelledError, Exception) as e:
+                logger.debug(f"Playwright stop note: {type(e).__name__}")
+
+        self.browser = None
+        self._playwright = None
+        self._launch_future = None
+
+
+_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool(headless: bool = False, max_concurrent: int = 4) -> BrowserPool:
+    """Get the process-wide browser pool, creating it on first use"""
+    global _pool
+    if _pool is None:
+        _pool = BrowserPool(headless=headless, max_concurrent=max_concurrent)
+    return _pool
+
+
+async def shutdown_browser_pool():
+    """Close the process-wide browser pool if it was created"""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+        logger.info("Browser pool shut down")
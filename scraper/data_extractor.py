@@ -6,877 +6,926 @@ Advanced JavaScript-Based Data Extractor
 - Completeness scoring (0-100%)
 """
 
+import asyncio
 import re
 import json
+import copy
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+from urllib.parse import urlparse
 from typing import Dict, List, Optional, Any
-from datetime import datetime
-from playwright.async_api import Page
+from playwright.async_api import Page, BrowserContext
+from .api_client import try_api_profile
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Section header tokens (lowercase substrings) -> section name, checked in order.
+# None marks sections we do not parse; they only end the previous section.
+SECTION_HEADERS = (
+    ('about', 'about'),
+    ('experience', 'experience'),
+    ('education', 'education'),
+    ('academic background', 'education'),
+    ('studies', 'education'),
+    ('skills', 'skills'),
+    ('competencies', 'skills'),
+    ('licenses', 'certifications'),
+    ('certifications', 'certifications'),
+    ('projects', 'projects'),
+    ('languages', 'languages'),
+    ('recommendations', 'recommendations'),
+    ('activity', None),
+    ('interests', None),
+    ('volunteering', None),
+    ('honors & awards', None),
+    ('publications', None),
+)
+
+# Section titles are short lines; longer lines mentioning a header word are content
+HEADER_MAX_LEN = 40
+
+# Optional: one automaton scan per line instead of a substring test per header token
+try:
+    import ahocorasick
+    _HEADER_AUTOMATON = ahocorasick.Automaton()
+    for _priority, (_token, _section) in enumerate(SECTION_HEADERS):
+        _HEADER_AUTOMATON.add_word(_token, (_priority, _section))
+    _HEADER_AUTOMATON.make_automaton()
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    _HEADER_AUTOMATON = None
+    AHOCORASICK_AVAILABLE = False
+
+
+def _scan_header(line_clean: str):
+    """Substring scan of a lowercased line for header tokens (see _match_header)"""
+    if _HEADER_AUTOMATON is not None:
+        # Several tokens may hit; the earliest SECTION_HEADERS entry wins, as in the fallback
+        hits = [value for _, value in _HEADER_AUTOMATON.iter(line_clean)]
+        return min(hits)[1] if hits else False
+    return next((section for token, section in SECTION_HEADERS if token in line_clean), False)
+
+
+# Section titles usually stand alone on their line - resolve those with one dict lookup.
+# Built through the scan itself, so an exact hit always agrees with it.
+_HEADER_TITLES = {
+    title: _scan_header(title)
+    for title in (*(token for token, _ in SECTION_HEADERS), 'licenses & certifications', 'work experience')
+}
+
+
+def _match_header(line_clean: str):
+    """Section a lowercased title line opens: its name, None for unparsed sections, False if not a header"""
+    if line_clean in _HEADER_TITLES:
+        return _HEADER_TITLES[line_clean]
+    return _scan_header(line_clean)
+
+# Fields counted towards the completeness score
+COMPLETENESS_FIELDS = ('name', 'headline', 'location', 'about', 'experience', 'education', 'skills')
+_COMPLETENESS_COUNT = len(COMPLETENESS_FIELDS)
+
+# Compiled once - these run per line on every profile
+_ENDORSE_RE = re.compile(r'\d+\s*(endorsements?)?', re.IGNORECASE)
+_WORD_RE = re.compile(r'[a-z]+')
+_CASED_WORD_RE = re.compile(r'[A-Za-z]+')
+_HAS_DIGIT = re.compile(r'\d').search  # C-level scan instead of a per-character generator
+
+# Contact info overlay patterns (parse_contact_info), compiled once
+# Profile section titles that end the contact info block
+_CONTACT_STOP_MARKERS = ('about', 'experience', 'education', 'skills', 'recommendations', 'causes')
+# Quantifiers are bounded (RFC 5321 local part / domain sizes, longest TLD) so a long run of
+# word characters with no '@' costs O(n), not O(n^2) backtracking
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]{1,64}@[a-zA-Z0-9.-]{1,253}\.[a-zA-Z]{2,24}')
+# Every phone shape in one alternation - a single scan of the text
+_PHONE_RE = re.compile(
+    r'(?:phone|tel|mobile)[:\s]+(?P<labeled>\+?[\d\s.\-()]{8,32})'  # Labeled phones (number only)
+    r'|\+[\d]{1,3}[\d\s.\-()]{8,32}'  # International format
+    r'|(?:^|\s)[\d]{3}[-.]?[\d]{3}[-.]?[\d]{4}(?:\s|$)'  # Standard format
+    r'|(?:^|\s)\([\d]{3}\)[\s]?[\d]{3}[-.][\d]{4}(?:\s|$)',  # (XXX) XXX-XXXX
+    re.IGNORECASE | re.MULTILINE,
+)
+# Profile URL (group 0) and its username (group 1) from a single match
+_CONTACT_LINKEDIN_RE = re.compile(r'(?:https?://)?(?:www\.)?linkedin\.com/in/([\w\-]+)', re.IGNORECASE)
+_GITHUB_RE = re.compile(r'https?://(?:www\.)?github\.com/[\w\-]+|github\.com/[\w\-]+', re.IGNORECASE)
+_HTTP_URL_RE = re.compile(r'https?://[^\s<>"\)]+')
+# Bare domains (like cuet.ac.bd, maksudcse.wordpress.com) - common extensions
+_DOMAIN_RE = re.compile(
+    r'\b([a-zA-Z0-9][\w\-]{0,62}(?:\.[a-zA-Z0-9][\w\-]{0,62})*\.(?:ac\.bd|com|org|net|edu|io|co|bd|wordpress\.com|github\.io|dev|app|in|us|uk|au|ca|de|fr|jp|cn|ru|in|tv|xyz|info|biz|name|me|cc))\b',
+    re.IGNORECASE | re.MULTILINE,
+)
+_NOISE_DOMAINS = ('linkedin', 'github', 'facebook', 'twitter', 'instagram', 'youtube', 'corp')
+_TWITTER_RES = (
+    re.compile(r'(?:twitter\.com/|@)(?P<handle>[\w\-]{1,15})', re.IGNORECASE),
+    re.compile(r'https?://(?:www\.)?twitter\.com/[\w\-]+', re.IGNORECASE),
+)
+_INSTAGRAM_RES = (
+    re.compile(r'(?:instagram\.com/|instagram\s+handle\s*:\s*)(?P<handle>[\w\.]{1,30})', re.IGNORECASE),
+    re.compile(r'instagram\s*:\s*(?P<handle>[\w\.]+)', re.IGNORECASE),
+)
+_FACEBOOK_RES = (
+    re.compile(r'(?:facebook\.com/|facebook\s+:\s*)(?P<handle>[\w\.\-]+)', re.IGNORECASE),
+    re.compile(r'facebook\s*:\s*(?P<handle>[\w\.\-]+)', re.IGNORECASE),
+)
+_WHATSAPP_RES = (
+    re.compile(r'(?:whatsapp|wa\.me)[:\s/]+(\+?[\d\s.\-()]{8,32})', re.IGNORECASE),
+    re.compile(r'whatsapp\s*:\s*(\+?[\d\s.\-()]{1,32})', re.IGNORECASE),
+)
+_TELEGRAM_RES = (
+    re.compile(r'(?:telegram|t\.me)[:\s/]+(?P<handle>[\w\-]{5,})', re.IGNORECASE),
+    re.compile(r'telegram\s*:\s*(?P<handle>[\w\-]+)', re.IGNORECASE),
+)
+_BIRTHDAY_RES = tuple(re.compile(p, re.IGNORECASE | re.MULTILINE) for p in (
+    r'(?:birthday|born|dob|date of birth)[:\s]+([A-Za-z]+\s+\d{1,2})',  # Month Day (e.g., April 8)
+    r'\b([A-Za-z]+\s+\d{1,2})\b(?=\s|$)',  # Month Day anywhere
+    r'(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})',  # DD-MM-YYYY or MM/DD/YY
+    r'([A-Za-z]+\s+\d{1,2},?\s+\d{4})',  # Month Day, Year
+))
+# Month names that make a birthday candidate valid (filters false positives)
+_MONTH_NAMES = ('january', 'february', 'march', 'april', 'may', 'june',
+                'july', 'august', 'september', 'october', 'november', 'december',
+                'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec')
+_SKYPE_RES = (
+    re.compile(r'(?:skype)[:\s]+(?P<handle>[\w\-\.]+)', re.IGNORECASE),
+    re.compile(r'skype\s*:\s*(?P<handle>[\w\-\.]+)', re.IGNORECASE),
+)
+_YOUTUBE_RE = re.compile(r'https?://(?:www\.)?youtube\.com/(?:channel/|c/|user/)?[\w\-]+', re.IGNORECASE)
+_TWITTER_URL_RE = re.compile(r'https?://(?:www\.)?twitter\.com/[\w\-]+', re.IGNORECASE)
+
+# Navigation/UI text that is never a name (substrings of the lowercased line)
+_NAME_SKIP_WORDS = (
+    'skip', 'main', 'content', 'button', 'http', 'follow', 'message', 'more',
+    'click', 'my network', 'network', 'show all', 'for business', 'sign in', 'join now',
+    'try premium', 'get up to', 'upgrade', 'followers', 'following', 'posts', 'comments',
+)
+# All of them in one case-insensitive alternation - a single C-level scan per line
+_NAME_SKIP_RE = re.compile('|'.join(map(re.escape, _NAME_SKIP_WORDS)), re.IGNORECASE)
+# A whole 3-149 character line containing none of them (for scanning a joined block of lines)
+_NAME_LINE_RE = re.compile(
+    r'^(?!.*(?:%s)).{3,149}$' % '|'.join(map(re.escape, _NAME_SKIP_WORDS)),
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Bullet/pipe separators that split the header area into name candidates
+_NAME_SEP_TABLE = str.maketrans({'•': '\n', '·': '\n', '|': '\n'})
+
+# Bullets and hyphens become spaces so str.split() can cut the words around them
+_NAME_PART_TABLE = str.maketrans({'•': ' ', '·': ' ', '-': ' '})
+
+# Activity phrases whose preceding words are usually the profile owner's name
+_ACTIVITY_PATTERNS = ('commented on a post', ' reposted ', ' posted ', ' liked ')
+_ACTIVITY_RE = re.compile('|'.join(map(re.escape, _ACTIVITY_PATTERNS)))
+
+# Keywords that mark a line as a job headline. Substring match, so 'engineer' also covers engineering/engineers and 'lead' leadership;
+# only the two-letter tokens need word boundaries (no 'ai' hit inside 'detail' or 'email')
+_JOB_KEYWORDS = (
+    'engineer', 'developer', 'manager', 'lead', 'specialist', 'architect',
+    'robotics', 'learning', 'python', 'founder', 'ceo', 'researcher', 'scientist',
+)
+_JOB_KEYWORD_RE = re.compile('|'.join(_JOB_KEYWORDS) + r'|\b(?:ai|ml)\b', re.IGNORECASE)
+
+# Words marking a line as UI/link text rather than section content. Matched against the
+# line's word set (one tokenization, O(1) lookups), so inflected forms are listed explicitly.
+_URL_WORDS = frozenset({'http', 'https'})
+_FOLLOW_WORDS = frozenset({'follow', 'follows', 'followers', 'following'})
+_ENDORSE_WORDS = frozenset({'endorse', 'endorsed', 'endorsement', 'endorsements'})
+_EDUCATION_SKIP = _URL_WORDS | _FOLLOW_WORDS | {'button'}
+_ENTRY_SKIP = _EDUCATION_SKIP | _ENDORSE_WORDS
+_LOCATION_SKIP = _EDUCATION_SKIP | {'message', 'messages', 'skill', 'skills', 'education', 'experience'}
+# About/Languages prose: only the capitalised button text counts, 'the following' does not
+_LINK_SKIP = _URL_WORDS | {'button', 'Follow', 'Follows', 'Followers', 'Following'}
+
+
+@lru_cache(maxsize=4096)
+def _line_words(line: str) -> frozenset:
+    """Lowercase word set of a line, computed once per distinct line"""
+    # The header-area fallbacks and the section builders test the same lines, and
+    # LinkedIn repeats many of them (visually-hidden duplicates, "Show all", ...)
+    return frozenset(_WORD_RE.findall(line.lower()))
+
+# Everything the extractor needs from the DOM, gathered in a single page.evaluate round-trip
+_PROFILE_BUNDLE_JS = """
+    () => {
+        // Name: the first h1 that is not navigation text
+        const name = (() => {
+            const navigationText = ['Skip to main content', 'For Business', 'Sign in', 'Join now',
+                                  'Search', 'Home', 'My Network', 'Messaging', 'Notifications',
+                                  'Jobs', 'Learning', 'Show all', 'More', 'Upgrade'];
+            for (const h1 of document.querySelectorAll('h1')) {
+                const text = h1.innerText.trim();
+                const isNavigation = navigationText.some(nav => nav.toLowerCase() === text.toLowerCase());
+                if (text && !isNavigation && text.length > 2 && text.length < 150) {
+                    // Name should have 1-5 words and contain letters
+                    const words = text.split(/\\s+/).filter(w => w);
+                    if (words.length >= 1 && words.length <= 5 && /[a-zA-Z]/.test(text)) {
+                        return text;
+                    }
+                }
+            }
+            return null;
+        })();
+
+        // Headline: the text-body-medium div right after the name
+        const headline = (() => {
+            const headlineDiv = document.querySelector('.text-body-medium[data-generated-suggestion-target*="profileActionDelegate"]');
+            if (headlineDiv) {
+                const text = headlineDiv.innerText.trim();
+                if (text && text.length > 3 && text.length < 500 &&
+                    !text.includes('Get up to') && !text.includes('InMail') && !text.includes('message')) {
+                    return text;
+                }
+            }
+
+            // Alternative: any medium-size text containing a pipe or job words
+            for (const elem of document.querySelectorAll('.text-body-medium, [class*="headline"]')) {
+                const text = elem.innerText.trim();
+                if (text && (text.includes('|') || text.includes('Machine') || text.includes('Engineer') ||
+                            text.includes('Developer') || text.includes('Robotics')) &&
+                    text.length > 3 && text.length < 500 &&
+                    !text.includes('Get up to') && !text.includes('InMail')) {
+                    return text;
+                }
+            }
+            return null;
+        })();
+
+        // Location: text-body-small that looks like "City, Country"
+        const location = (() => {
+            for (const span of document.querySelectorAll('.text-body-small')) {
+                const text = span.innerText.trim();
+                if (text && text.includes(',') && text.length > 3 && text.length < 150 &&
+                    !text.includes('http') && !text.includes('Follow') && !text.includes('Message')) {
+                    if (text.match(/[A-Za-z]+,\\s*[A-Za-z]+/) ||
+                        text.includes('Area') || text.includes('Remote') || text.includes('Based')) {
+                        return text;
+                    }
+                }
+            }
+            return null;
+        })();
+
+        // Recommendations: search only the recommendations card, stop at 5, reuse per URL
+        const recommendations = (() => {
+            const cached = window.__recCache;
+            if (cached && cached.url === window.location.href) {
+                return cached.recs;
+            }
+            const anchor = document.querySelector('#recommendations');
+            const root = (anchor && anchor.closest('section')) ||
+                         document.querySelector('section[data-section="recommendations"]') ||
+                         document.body;
+            const recs = [];
+            for (const div of root.querySelectorAll('[class*="recommendation"]')) {
+                const text = div.innerText;
+                if (text && text.length > 20) {
+                    recs.push({text: text.substring(0, 500)});
+                    if (recs.length === 5) break;
+                }
+            }
+            // Cards load lazily - only remember a non-empty result
+            if (recs.length) {
+                window.__recCache = {url: window.location.href, recs};
+            }
+            return recs;
+        })();
+
+        return {allText: document.body.innerText || null, name, headline, location, recommendations};
+    }
+"""
+
+# Installed once per context (see DataExtractor.attach) so each profile only sends a short call
+# instead of the whole source. Non-enumerable to stay out of casual window key scans
+_PROFILE_BUNDLE_INIT_JS = (
+    "Object.defineProperty(window, '__triBundle', "
+    "{value: " + _PROFILE_BUNDLE_JS.strip() + ", enumerable: false, configurable: true});"
+)
+_PROFILE_BUNDLE_CALL_JS = "() => typeof window.__triBundle === 'function' ? window.__triBundle() : null"
+
+
+def parse_sections(lines: List[str]) -> Dict[str, List[str]]:
+    """Single pass over the page lines (stripped, non-empty), collecting the lines of each section"""
+    sections: Dict[str, List[str]] = {}
+    current = None
+    start = 0  # index of the first line after the last header seen
+    
+    # Only header lines are inspected in Python; each section's content is
+    # copied with one list slice between its header and the next one
+    for i, line in enumerate(lines):
+        if len(line) > HEADER_MAX_LEN:
+            continue
+        header = _match_header(line.lower())
+        if header is False:
+            continue
+        
+        if current:
+            sections[current].extend(lines[start:i])
+        # Only the first occurrence of a section is collected
+        if header != current:
+            current = header if header is not None and header not in sections else None
+            if current:
+                sections[current] = []
+        start = i + 1
+    
+    if current:
+        sections[current].extend(lines[start:])
+    
+    return sections
+
 
 class DataExtractor:
     """Extract LinkedIn profile data using JavaScript evaluation + text parsing"""
     
-    def __init__(self):
+    # Completed profiles kept per URL (LRU) and how long they stay fresh
+    PROFILE_CACHE_SIZE = 1024
+    PROFILE_CACHE_TTL = 3600.0
+    
+    def __init__(self, cache_profiles: bool = True):
+        """
+        Initialize data extractor
+        
+        Args:
+            cache_profiles: Reuse profiles extracted within PROFILE_CACHE_TTL instead of re-scraping
+        """
         self.extracted_data = {}
         self.scrape_agent = None  # Will be set by scrape_agent when needed
+        self.cache_profiles = cache_profiles
+        self._profile_cache: OrderedDict = OrderedDict()  # url -> (timestamp, profile)
+    
+    def get_cached_profile(self, profile_url: str) -> Optional[Dict]:
+        """Return a copy of a recently extracted profile, or None if absent/expired"""
+        if not self.cache_profiles:
+            return None
+        entry = self._profile_cache.get(profile_url)
+        if entry is None:
+            return None
+        
+        stored_at, profile_data = entry
+        if time.monotonic() - stored_at > self.PROFILE_CACHE_TTL:
+            del self._profile_cache[profile_url]
+            return None
+        
+        self._profile_cache.move_to_end(profile_url)
+        return copy.deepcopy(profile_data)
+    
+    def _cache_profile(self, profile_url: str, profile_data: Dict):
+        """Remember an extracted profile, evicting the least recently used beyond the limit"""
+        if not self.cache_profiles:
+            return
+        self._profile_cache[profile_url] = (time.monotonic(), copy.deepcopy(profile_data))
+        self._profile_cache.move_to_end(profile_url)
+        while len(self._profile_cache) > self.PROFILE_CACHE_SIZE:
+            self._profile_cache.popitem(last=False)
+    
+    async def extract_profile_via_api(self, context: BrowserContext, profile_url: str) -> Optional[Dict]:
+        """Fetch the profile through LinkedIn's JSON API with the browser session (None -> use the page)"""
+        profile_data = await try_api_profile(context, profile_url)
+        if not profile_data:
+            return None
+        
+        profile_data['completeness'] = self._calculate_completeness(profile_data)
+        logger.info(f"Profile fetched via API: {profile_data.get('name', 'Unknown')} ({profile_data['completeness']}% complete)")
+        self._cache_profile(profile_url, profile_data)
+        return profile_data
+    
+    async def extract_many(self, browser, profile_urls: List[str], concurrency: int = 5) -> List[Optional[Dict]]:
+        """Extract several profiles on parallel pages of a BrowserController's shared context
+        
+        Args:
+            browser: BrowserController providing acquire_page()/release_page()
+            profile_urls: Profiles to load and extract
+            concurrency: Maximum pages loading at the same time
+        
+        Returns:
+            One profile dict (or None on failure) per URL, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def extract_one(profile_url: str) -> Optional[Dict]:
+            async with semaphore:
+                cached = self.get_cached_profile(profile_url)
+                if cached:
+                    return cached
+                
+                page = None
+                try:
+                    page = await browser.acquire_page()
+                    await page.goto(profile_url, wait_until='domcontentloaded', timeout=60000)
+                    return await self.extract_complete_profile(page, profile_url, with_contact_info=False)
+                except Exception as e:
+                    logger.warning(f"Batch extraction failed for {profile_url}: {e}")
+                    return None
+                finally:
+                    if page is not None:
+                        await browser.release_page(page)
+        
+        return await asyncio.gather(*(extract_one(url) for url in profile_urls))
     
-    async def extract_complete_profile(self, page: Page, profile_url: str) -> Optional[Dict]:
+    async def extract_complete_profile(self, page: Page, profile_url: str,
+                                       with_contact_info: bool = True) -> Optional[Dict]:
         """Extract complete profile using JavaScript evaluation"""
+        # with_contact_info=False skips the contact overlay, which the scrape agent opens on its own page
         try:
+            cached = self.get_cached_profile(profile_url)
+            if cached:
+                logger.info(f"Using cached profile data for {profile_url}")
+                return cached
+            
             logger.info(f"Extracting profile data from {profile_url}")
             
-            # Get all page text via JavaScript (most reliable method)
-            all_text = await self._extract_all_with_js(page)
+            # One round-trip returns the page text plus the DOM-based field candidates
+            bundle = await self._extract_bundle(page)
+            all_text = bundle.get('allText') if bundle else None
             
-            if not all_text:
+            # A blank page (still loading, or an auth wall) has nothing to parse - bail out
+            # before the parse thread and the contact overlay navigation, and don't cache it
+            if not all_text or all_text.isspace():
                 logger.warning("Could not extract page content")
                 return None
             
             profile_data = {
                 'profile_url': profile_url,
-                'scraped_at': datetime.now().isoformat(),
+                'scraped_at_ns': time.time_ns(),  # formatted only when persisted
                 'extraction_method': 'javascript-text-based'
             }
             
-            # Extract basic info - use JavaScript first, then text fallbacks
-            profile_data['name'] = await self._extract_name(page, all_text)
-            profile_data['headline'] = await self._extract_headline(page, all_text)
-            profile_data['location'] = await self._extract_location(page, all_text)
-            profile_data['about'] = await self._extract_about(page, all_text)
+            # The text parsing is pure CPU work - run it off the event loop so
+            # sibling pages in extract_many keep making progress meanwhile
+            parse = asyncio.to_thread(self._parse_text, bundle, all_text)
             
-            # Extract contact info (if scrape_agent is available)
-            if self.scrape_agent:
-                contact_info = await self.scrape_agent._extract_contact_info()
-                if contact_info:
-                    profile_data['contact_info'] = contact_info
-                    logger.debug("Extracted contact info via scrape_agent")
+            # Extract contact info (if scrape_agent is available). The page text is already
+            # captured, so the overlay round-trip overlaps with the parsing thread
+            if self.scrape_agent and with_contact_info:
+                parsed, contact_info = await asyncio.gather(
+                    parse, self.scrape_agent._extract_contact_info(), return_exceptions=True
+                )
+            else:
+                parsed, contact_info = await parse, None
+            
+            if isinstance(parsed, BaseException):
+                raise parsed
+            profile_data.update(parsed['basic'])
             
-            # Extract sections using text parsing
-            profile_data['experience'] = await self._extract_experience(page, all_text)
-            profile_data['education'] = await self._extract_education(page, all_text)
-            profile_data['skills'] = await self._extract_skills(page, all_text)
-            profile_data['certifications'] = await self._extract_certifications(page, all_text)
-            profile_data['projects'] = await self._extract_projects(page, all_text)
-            profile_data['languages'] = await self._extract_languages(page, all_text)
-            profile_data['recommendations'] = await self._extract_recommendations(page, all_text)
+            if isinstance(contact_info, BaseException):
+                logger.debug(f"Contact info extraction failed: {contact_info}")
+            elif contact_info:
+                profile_data['contact_info'] = contact_info
+                logger.debug("Extracted contact info via scrape_agent")
+            
+            profile_data.update(parsed['sections'])
+            profile_data['recommendations'] = bundle.get('recommendations') or []
             
             # Calculate completeness score
             profile_data['completeness'] = self._calculate_completeness(profile_data)
             
             logger.info(f"Profile extraction completed: {profile_data.get('name', 'Unknown')} ({profile_data['completeness']}% complete)")
+            self._cache_profile(profile_url, profile_data)
             return profile_data
             
         except Exception as e:
             logger.error(f"Profile extraction failed: {e}")
             return None
     
-    async def _extract_all_with_js(self, page: Page) -> Optional[str]:
-        """Extract all page text using JavaScript - most reliable method"""
+    async def attach(self, browser):
+        """Pre-install the bundle function in every page of the browser controller's contexts"""
+        await browser.add_init_script(_PROFILE_BUNDLE_INIT_JS)
+    
+    async def _extract_bundle(self, page: Page) -> Optional[Dict[str, Any]]:
+        """Get page text, name/headline/location candidates and recommendations in one evaluate"""
         try:
-            all_text = await page.evaluate("""
-                () => {
-                    // Get all visible text from page
-                    const allText = document.body.innerText;
-                    return allText || null;
-                }
-            """)
-            return all_text
+            bundle = await page.evaluate(_PROFILE_BUNDLE_CALL_JS)
+            if bundle is None:
+                # Not attached, or the page loaded before attach - send the full source
+                bundle = await page.evaluate(_PROFILE_BUNDLE_JS)
+            return bundle
         except Exception as e:
             logger.warning(f"Error extracting with JavaScript: {e}")
             return None
     
-    async def _extract_name(self, page: Page, all_text: str) -> Optional[str]:
-        """Extract name using multiple JavaScript methods"""
-        try:
-            # Skip JavaScript - it's picking up navigation text
-            # Go straight to fallback text extraction which is more reliable
-            name = await self._extract_name_fallback(all_text)
-            if name:
-                return name
-            
-            # If fallback didn't work, try this JavaScript as last resort
-            # Look for the LinkedIn profile header structure (main profile section)
-            name = await page.evaluate("""
-                () => {
-                    // The profile name is typically the first h1 in the main profile area
-                    // LinkedIn puts the name in a specific section - look for visible text
-                    const allH1s = document.querySelectorAll('h1');
-                    const navigationText = ['Skip to main content', 'For Business', 'Sign in', 'Join now', 
-                                          'Search', 'Home', 'My Network', 'Messaging', 'Notifications',
-                                          'Jobs', 'Learning', 'Show all', 'More', 'Upgrade'];
-                    
-                    // Find the first h1 that's NOT navigation text
-                    for (let h1 of allH1s) {
-                        const text = h1.innerText.trim();
-                        const isNavigation = navigationText.some(nav => nav.toLowerCase() === text.toLowerCase());
-                        
-                        if (text && !isNavigation && text.length > 2 && text.length < 150) {
-                            // Additional validation - name should have 1-5 words and be mostly letters
-                            const words = text.split(/\\s+/).filter(w => w);
-                            if (words.length >= 1 && words.length <= 5) {
-                                // Check if it looks like a real name (has letters)
-                                if (/[a-zA-Z]/.test(text)) {
-                                    return text;
-                                }
-                            }
-                        }
-                    }
-                    return null;
-                }
-            """)
-            
-            if name and len(name) > 2 and len(name) < 150:
-                return name.strip()
-            
-            return None
-            
-        except Exception as e:
-            logger.debug(f"Error extracting name with JS: {e}")
-            return await self._extract_name_fallback(all_text)
+    def _parse_text(self, bundle: Dict[str, Any], all_text: str) -> Dict[str, Dict[str, Any]]:
+        """Run every text parser over the page text (synchronous, safe to run in a thread)"""
+        # Split once, strip once and drop blank lines (a large share of innerText);
+        # every text parser below works on this list
+        lines = [line.strip() for line in all_text.splitlines() if line and not line.isspace()]
+        
+        # One pass routes every line to its section
+        sections = parse_sections(lines)
+        
+        return {
+            # Basic info - DOM candidates from the bundle, text fallbacks otherwise
+            'basic': {
+                'name': self._extract_name(bundle.get('name'), lines, all_text),
+                'headline': self._extract_headline(bundle.get('headline'), lines),
+                'location': self._extract_location(bundle.get('location'), lines),
+                'about': self._finalize_about(sections.get('about', ())),
+            },
+            # Section entries built from their lines
+            'sections': {
+                'experience': self._finalize_experience(sections.get('experience', ())),
+                'education': self._finalize_education(sections.get('education', ())),
+                'skills': self._finalize_skills(sections.get('skills', ())),
+                'certifications': self._finalize_certifications(sections.get('certifications', ())),
+                'projects': self._finalize_projects(sections.get('projects', ())),
+                'languages': self._finalize_languages(sections.get('languages', ())),
+            },
+        }
     
-    async def _extract_name_fallback(self, all_text: str) -> Optional[str]:
+    def _extract_name(self, js_name: Optional[str], lines: List[str], all_text: str) -> Optional[str]:
+        """Extract name from text, falling back to the page's h1"""
+        # The text fallback is more reliable - the h1 scan can pick up navigation text
+        name = self._extract_name_fallback(lines, all_text)
+        if name:
+            return name
+        
+        if js_name and len(js_name) > 2 and len(js_name) < 150:
+            return js_name.strip()
+        return None
+    
+    def _extract_name_fallback(self, lines: List[str], all_text: str) -> Optional[str]:
         """Fallback name extraction from text - try multiple strategies"""
-        try:
-            # Split by common text separators since about is often one long line
-            # Replace common separators with newlines to split better
-            text = all_text.replace('•', '\n').replace('·', '\n').replace('|', '\n')
-            text = text.replace('Activity', '\nActivity\n')  # Mark activity section
-            lines = text.split('\n')
-            
-            # Skip navigation text, find real name
-            skip_words = ['skip', 'main', 'content', 'button', 'http', 'follow', 'message', 'more', 
-                         'click', 'my network', 'network', 'show all', 'for business', 'sign in', 'join now',
-                         'try premium', 'get up to', 'upgrade', 'followers', 'following', 'posts', 'comments']
-            
-            # Strategy 1: Look for name in first 30 lines (profile header area)
-            for line in lines[:30]:
-                line = line.strip()
-                if line and len(line) > 2 and len(line) < 150:
-                    # Check if line looks like a name (not navigation text)
-                    if not any(skip in line.lower() for skip in skip_words):
-                        # Name typically has 2-5 words, starts with capital
-                        words = line.split()
-                        if 2 <= len(words) <= 5 and len(words) >= 2 and line[0].isupper():
-                            return line
-            
-            # Strategy 2: Extract from activity patterns like "X commented on a post", "X reposted", etc
-            # Look for these activity verbs
-            activity_patterns = ['commented on a post', ' reposted ', ' posted ', ' liked ']
-            
-            for pattern in activity_patterns:
-                if pattern in all_text:
-                    # Find the first occurrence
-                    idx = all_text.find(pattern)
-                    if idx > 0:
-                        # Get text before the pattern
-                        before_text = all_text[:idx].strip()
-                        # Split into words
-                        parts = re.split(r'[\s•·\-]+', before_text)
-                        # Get the last non-empty parts
-                        parts = [p.strip() for p in parts if p.strip()]
-                        if parts:
-                            # Usually the name is the last 2-4 words (prefer 3-4 for full names)
-                            for num_words in [4, 3, 2]:
-                                if len(parts) >= num_words:
-                                    name_part = ' '.join(parts[-num_words:])
-                                    name_part = name_part.strip()
-                                    if name_part and len(name_part) > 2 and len(name_part) < 100:
-                                        # Check if first char is uppercase and not in skip list
-                                        if name_part[0].isupper() and not any(skip in name_part.lower() for skip in skip_words):
-                                            # Should have at least one space (multiple words)
-                                            if ' ' in name_part:
-                                                return name_part
-            
-            return None
-        except Exception as e:
-            logger.debug(f"Error in fallback name extraction: {e}")
+        # Split by common text separators since about is often one long line.
+        # Only the header area is needed, so split the shared lines lazily
+        # instead of translating and re-splitting the whole page
+        candidates = (
+            part
+            for line in lines
+            for part in line.translate(_NAME_SEP_TABLE).replace('Activity', '\nActivity\n').split('\n')
+        )
+        
+        # Strategy 1: Look for name in first 30 lines (profile header area).
+        # The regex engine filters out navigation text and bad lengths in one scan
+        header_area = '\n'.join(line.strip() for line in islice(candidates, 30))
+        for match in _NAME_LINE_RE.finditer(header_area):
+            line = match.group()
+            # Name typically has 2-5 words, starts with capital
+            if line[:1].isupper() and 2 <= len(line.split()) <= 5:
+                return line
+        
+        # Strategy 2: Extract from activity patterns like "X commented on a post", "X reposted", etc
+        # One scan for all phrases: skip the strategy when none occurs, otherwise no
+        # phrase can occur before this first hit, so the finds below start there
+        first = _ACTIVITY_RE.search(all_text)
+        if not first:
             return None
+        for pattern in _ACTIVITY_PATTERNS:
+            # Find the first occurrence (-1 if absent)
+            idx = all_text.find(pattern, first.start())
+            if idx > 0:
+                # Split the text before the pattern into words (split() drops empties)
+                parts = all_text[:idx].translate(_NAME_PART_TABLE).split()
+                if parts:
+                    # Usually the name is the last 2-4 words (prefer 3-4 for full names)
+                    for num_words in [4, 3, 2]:
+                        if len(parts) >= num_words:
+                            # Joined split() words: never empty, no outer whitespace
+                            name_part = ' '.join(parts[-num_words:])
+                            if 2 < len(name_part) < 100:
+                                # Check if first char is uppercase and not in skip list
+                                if name_part[:1].isupper() and not _NAME_SKIP_RE.search(name_part):
+                                    # Should have at least one space (multiple words)
+                                    if ' ' in name_part:
+                                        return name_part
+        
+        return None
     
-    async def _extract_headline(self, page: Page, all_text: str) -> Optional[str]:
-        """Extract headline (job title/skills) using JavaScript"""
-        try:
-            # JavaScript method - look for the specific headline structure
-            headline = await page.evaluate("""
-                () => {
-                    // Look for the text-body-medium div right after name (contains headline)
-                    const headlineDiv = document.querySelector('.text-body-medium[data-generated-suggestion-target*="profileActionDelegate"]');
-                    if (headlineDiv) {
-                        const text = headlineDiv.innerText.trim();
-                        if (text && text.length > 3 && text.length < 500 && 
-                            !text.includes('Get up to') && !text.includes('InMail') && !text.includes('message')) {
-                            return text;
-                        }
-                    }
-                    
-                    // Alternative: Look for any div with medium text size containing pipe or skills
-                    const mediumTexts = document.querySelectorAll('.text-body-medium, [class*="headline"]');
-                    for (let elem of mediumTexts) {
-                        const text = elem.innerText.trim();
-                        if (text && (text.includes('|') || text.includes('Machine') || text.includes('Engineer') || 
-                                    text.includes('Developer') || text.includes('Robotics')) && 
-                            text.length > 3 && text.length < 500 &&
-                            !text.includes('Get up to') && !text.includes('InMail')) {
-                            return text;
-                        }
-                    }
-                    
-                    return null;
-                }
-            """)
-            
-            if headline and len(headline) > 3 and len(headline) < 500 and 'get up to' not in headline.lower():
-                return headline.strip()
-            
-            # Text fallback - look for headlines after name
-            return await self._extract_headline_fallback(all_text)
-            
-        except Exception as e:
-            logger.debug(f"Error extracting headline: {e}")
-            return await self._extract_headline_fallback(all_text)
+    def _extract_headline(self, js_headline: Optional[str], lines: List[str]) -> Optional[str]:
+        """Extract headline (job title/skills), preferring the DOM candidate"""
+        if js_headline and len(js_headline) > 3 and len(js_headline) < 500 and 'get up to' not in js_headline.lower():
+            return js_headline.strip()
+        
+        # Text fallback - look for headlines after name
+        return self._extract_headline_fallback(lines)
     
-    async def _extract_headline_fallback(self, all_text: str) -> Optional[str]:
+    def _extract_headline_fallback(self, lines: List[str]) -> Optional[str]:
         """Fallback headline extraction from page content - look for | or engineering keywords"""
-        try:
-            lines = all_text.split('\n')
-            # Headline usually appears in first 40 lines and contains job-related keywords or pipes
-            headline_keywords = ['engineer', 'developer', 'manager', 'lead', 'specialist', 'architect',
-                               'robotics', 'learning', 'ai', 'ml', 'python', 'founder', 'ceo', 'researcher', 'scientist']
-            
-            for line in lines[2:50]:
-                line = line.strip()
-                if line and len(line) > 5 and len(line) < 500:
-                    # Check for pipe separator (common in LinkedIn headlines)
-                    if '|' in line:
+        # Headline usually appears in first 40 lines and contains job-related keywords or pipes
+        for line in islice(lines, 2, 50):
+            if len(line) > 5 and len(line) < 500:
+                # Check for pipe separator (common in LinkedIn headlines)
+                if '|' in line:
+                    return line
+                # Or check for keywords
+                if _JOB_KEYWORD_RE.search(line):
+                    # Skip if it contains too much text (probably from about section)
+                    if len(line) < 200 and line.count(' ') < 30:
                         return line
-                    # Or check for keywords
-                    if any(kw in line.lower() for kw in headline_keywords):
-                        # Skip if it contains too much text (probably from about section)
-                        if len(line) < 200 and line.count(' ') < 30:
-                            return line
-            return None
-        except:
-            return None
+        return None
     
-    async def _extract_location(self, page: Page, all_text: str) -> Optional[str]:
-        """Extract location using JavaScript and text parsing"""
-        try:
-            # JavaScript method - look for location text in specific patterns
-            location = await page.evaluate("""
-                () => {
-                    // Look for text-body-small containing location info
-                    const locationSpans = document.querySelectorAll('.text-body-small');
-                    for (let span of locationSpans) {
-                        const text = span.innerText.trim();
-                        // Location usually has comma and specific patterns
-                        if (text && text.includes(',') && text.length > 3 && text.length < 150 && 
-                            !text.includes('http') && !text.includes('Follow') && !text.includes('Message')) {
-                            // Check if it looks like a location (has words like "Area", city patterns, country)
-                            if (text.match(/[A-Za-z]+,\\s*[A-Za-z]+/) || 
-                                text.includes('Area') || text.includes('Remote') || text.includes('Based')) {
-                                return text;
-                            }
-                        }
-                    }
-                    
-                    return null;
-                }
-            """)
-            
-            if location:
-                return location.strip()
-            
-            # Text fallback
-            return await self._extract_location_fallback(all_text)
-            
-        except Exception as e:
-            logger.debug(f"Error extracting location: {e}")
-            return await self._extract_location_fallback(all_text)
+    def _extract_location(self, js_location: Optional[str], lines: List[str]) -> Optional[str]:
+        """Extract location, preferring the DOM candidate"""
+        if js_location:
+            return js_location.strip()
+        
+        # Text fallback
+        return self._extract_location_fallback(lines)
     
-    async def _extract_location_fallback(self, all_text: str) -> Optional[str]:
+    def _extract_location_fallback(self, lines: List[str]) -> Optional[str]:
         """Fallback location extraction from text"""
-        try:
-            lines = all_text.split('\n')
-            # Location typically appears early in profile, has comma, and follows education/work info
-            for i, line in enumerate(lines[:50]):
-                line = line.strip()
-                # Look for pattern: City, Country or City, State, Country
-                if line and ',' in line and len(line) > 3 and len(line) < 150:
-                    # Check for common location indicators
-                    if not any(x in line.lower() for x in ['http', 'button', 'follow', 'message', 'skill', 'education', 'experience']):
-                        # Simple heuristic: if has 2+ parts separated by comma with alphabetic chars
-                        parts = line.split(',')
-                        if len(parts) >= 2 and all(len(p.strip()) > 0 for p in parts):
-                            return line
-            return None
-        except:
-            return None
+        # Location typically appears early in profile, has comma, and follows education/work info
+        for line in islice(lines, 50):
+            # Look for pattern: City, Country or City, State, Country
+            if ',' in line and len(line) > 3 and len(line) < 150:
+                # Check for common location indicators
+                if _LOCATION_SKIP.isdisjoint(_line_words(line)):
+                    # Simple heuristic: if has 2+ parts separated by comma with alphabetic chars
+                    parts = line.split(',')
+                    if len(parts) >= 2 and all(len(p.strip()) > 0 for p in parts):
+                        return line
+        return None
     
-    async def _extract_about(self, page: Page, all_text: str) -> Optional[str]:
-        """Extract About section"""
-        try:
-            lines = all_text.split('\n')
-            about_started = False
-            about_text = []
-            
-            for i, line in enumerate(lines):
-                if 'About' in line:
-                    about_started = True
-                    continue
-                
-                if about_started:
-                    # Stop at next section
-                    if any(section in line for section in ['Experience', 'Education', 'Skills', 'Licenses']):
-                        break
-                    
-                    line = line.strip()
-                    if line and not any(x in line for x in ['http', 'button', 'Follow']):
-                        about_text.append(line)
-            
-            return ' '.join(about_text).strip() if about_text else None
-            
-        except Exception as e:
-            logger.debug(f"Error extracting about: {e}")
-            return None
+    def _finalize_about(self, lines: List[str]) -> Optional[str]:
+        """Join About section lines, dropping link/button text"""
+        about_text = [line for line in lines if _LINK_SKIP.isdisjoint(_CASED_WORD_RE.findall(line))]
+        return ' '.join(about_text) if about_text else None
     
-    async def _extract_experience(self, page: Page, all_text: str) -> List[Dict]:
-        """Extract experience entries from text (robust section detection)"""
+    def _finalize_experience(self, lines: List[str]) -> List[Dict]:
+        """Build experience entries from the Experience section lines"""
         experiences = []
-        try:
-            lines = all_text.split('\n')
-            exp_started = False
-            current_exp = None
-            section_headers = ['experience', 'work experience', 'professional experience']
-            stop_sections = ['education', 'skills', 'licenses', 'certifications', 'projects', 'languages', 'recommendations']
-            for i, line in enumerate(lines):
-                line_clean = line.strip().lower()
-                # Start of experience section (case-insensitive, alternate names)
-                if any(h in line_clean for h in section_headers) and not exp_started:
-                    exp_started = True
-                    continue
-                # Stop at next major section
-                if exp_started and any(section in line_clean for section in stop_sections):
-                    if current_exp and current_exp.get('title'):
-                        experiences.append(current_exp)
-                    break
-                if exp_started and line:
-                    # New job entry - starts with job title (no special characters)
-                    if not any(c in line.lower() for c in ['http', 'follow', 'endorse', 'button']) and len(line) > 5:
-                        if current_exp and current_exp.get('title'):
-                            experiences.append(current_exp)
-                        current_exp = {'title': line}
-                    elif current_exp:
-                        if 'company' not in current_exp and (any(x in line for x in ['Inc', 'Ltd', ',']) or len(line) > 20):
-                            current_exp['company'] = line
-                        elif 'duration' not in current_exp and any(c.isdigit() for c in line):
-                            current_exp['duration'] = line
-                        elif 'description' not in current_exp and len(line) > 10:
-                            current_exp['description'] = line
-            if current_exp and current_exp.get('title'):
-                experiences.append(current_exp)
-            logger.info(f"Extracted {len(experiences)} experience entries")
-            return experiences
-        except Exception as e:
-            logger.warning(f"Error extracting experience: {e}")
-            return experiences
+        current_exp = None
+        for line in lines:
+            # New job entry - starts with job title (no special characters)
+            if len(line) > 5 and _ENTRY_SKIP.isdisjoint(_line_words(line)):
+                if current_exp and current_exp.get('title'):
+                    experiences.append(current_exp)
+                current_exp = {'title': line}
+            elif current_exp:
+                if 'company' not in current_exp and (any(x in line for x in ['Inc', 'Ltd', ',']) or len(line) > 20):
+                    current_exp['company'] = line
+                elif 'duration' not in current_exp and _HAS_DIGIT(line):
+                    current_exp['duration'] = line
+                elif 'description' not in current_exp and len(line) > 10:
+                    current_exp['description'] = line
+        if current_exp and current_exp.get('title'):
+            experiences.append(current_exp)
+        logger.info(f"Extracted {len(experiences)} experience entries")
+        return experiences
     
-    async def _extract_education(self, page: Page, all_text: str) -> List[Dict]:
-        """Extract education entries (robust section detection)"""
+    def _finalize_education(self, lines: List[str]) -> List[Dict]:
+        """Build education entries from the Education section lines"""
         education = []
-        try:
-            lines = all_text.split('\n')
-            edu_started = False
-            current_edu = None
-            section_headers = ['education', 'academic background', 'studies']
-            stop_sections = ['skills', 'licenses', 'projects', 'languages', 'recommendations', 'experience']
-            for line in lines:
-                line_clean = line.strip().lower()
-                if any(h in line_clean for h in section_headers) and not edu_started:
-                    edu_started = True
-                    continue
-                if edu_started and any(section in line_clean for section in stop_sections):
+        current_edu = None
+        for line in lines:
+            if len(line) > 3 and _EDUCATION_SKIP.isdisjoint(_line_words(line)):
+                if 'school' not in current_edu if current_edu else True:
                     if current_edu and current_edu.get('school'):
                         education.append(current_edu)
-                    break
-                if edu_started and line:
-                    if not any(c in line.lower() for c in ['http', 'follow', 'button']) and len(line) > 3:
-                        if 'school' not in current_edu if current_edu else True:
-                            if current_edu and current_edu.get('school'):
-                                education.append(current_edu)
-                            current_edu = {'school': line}
-                        elif current_edu:
-                            if 'degree' not in current_edu:
-                                current_edu['degree'] = line
-                            elif 'duration' not in current_edu and any(c.isdigit() for c in line):
-                                current_edu['duration'] = line
-            if current_edu and current_edu.get('school'):
-                education.append(current_edu)
-            logger.info(f"Extracted {len(education)} education entries")
-            return education
-        except Exception as e:
-            logger.warning(f"Error extracting education: {e}")
-            return education
+                    current_edu = {'school': line}
+                elif current_edu:
+                    if 'degree' not in current_edu:
+                        current_edu['degree'] = line
+                    elif 'duration' not in current_edu and _HAS_DIGIT(line):
+                        current_edu['duration'] = line
+        if current_edu and current_edu.get('school'):
+            education.append(current_edu)
+        logger.info(f"Extracted {len(education)} education entries")
+        return education
     
-    async def _extract_skills(self, page: Page, all_text: str) -> List[str]:
-        """Extract skills list (robust section detection)"""
-        skills = []
-        try:
-            lines = all_text.split('\n')
-            skill_started = False
-            section_headers = ['skills', 'core skills', 'competencies']
-            stop_sections = ['licenses', 'projects', 'languages', 'certifications', 'recommendations', 'education', 'experience']
-            for line in lines:
-                line_clean = line.strip().lower()
-                if any(h in line_clean for h in section_headers):
-                    skill_started = True
-                    continue
-                if skill_started:
-                    if any(section in line_clean for section in stop_sections):
-                        break
-                    if line and not any(c in line.lower() for c in ['http', 'follow', 'endorse', 'button']):
-                        skill_clean = re.sub(r'\d+\s*(endorsements?)?', '', line, flags=re.IGNORECASE).strip()
-                        if skill_clean and len(skill_clean) > 1 and len(skill_clean) < 100:
-                            skills.append(skill_clean)
-            skills = list(dict.fromkeys(skills))
-            logger.info(f"Extracted {len(skills)} skills")
-        except Exception as e:
-            logger.warning(f"Error extracting skills: {e}")
-        return skills
+    def _finalize_skills(self, lines: List[str]) -> List[str]:
+        """Build the skills list from the Skills section lines"""
+        skills: Dict[str, None] = {}  # insertion-ordered; repeats are absorbed as we go
+        for line in lines:
+            if _ENTRY_SKIP.isdisjoint(_line_words(line)):
+                skill_clean = _ENDORSE_RE.sub('', line).strip()
+                if skill_clean and len(skill_clean) > 1 and len(skill_clean) < 100:
+                    skills[skill_clean] = None
+        logger.info(f"Extracted {len(skills)} skills")
+        return list(skills)
     
-    async def _extract_certifications(self, page: Page, all_text: str) -> List[Dict]:
-        """Extract certifications"""
+    def _finalize_certifications(self, lines: List[str]) -> List[Dict]:
+        """Build certification entries from the Licenses & certifications lines"""
         certs = []
-        try:
-            lines = all_text.split('\n')
-            cert_started = False
-            current_cert = None
-            
-            for line in lines:
-                line = line.strip()
-                
-                if 'Licenses' in line or 'Certifications' in line:
-                    cert_started = True
-                    continue
-                
-                if cert_started and any(section in line for section in ['Projects', 'Languages', 'Skills']):
-                    if current_cert and current_cert.get('name'):
-                        certs.append(current_cert)
-                    break
-                
-                if cert_started and line:
-                    if 'name' not in (current_cert or {}):
-                        current_cert = {'name': line}
-                    elif current_cert:
-                        if 'issuer' not in current_cert:
-                            current_cert['issuer'] = line
-                        elif 'date' not in current_cert and any(c.isdigit() for c in line):
-                            current_cert['date'] = line
-            
-            if current_cert and current_cert.get('name'):
-                certs.append(current_cert)
-            
-            logger.info(f"Extracted {len(certs)} certifications")
-            return certs
-            
-        except Exception as e:
-            logger.warning(f"Error extracting certifications: {e}")
-            return certs
+        current_cert = None
+        for line in lines:
+            if 'name' not in (current_cert or {}):
+                current_cert = {'name': line}
+            elif 'issuer' not in current_cert:
+                current_cert['issuer'] = line
+            elif 'date' not in current_cert and _HAS_DIGIT(line):
+                current_cert['date'] = line
+        if current_cert and current_cert.get('name'):
+            certs.append(current_cert)
+        logger.info(f"Extracted {len(certs)} certifications")
+        return certs
     
-    async def _extract_projects(self, page: Page, all_text: str) -> List[Dict]:
-        """Extract projects"""
+    def _finalize_projects(self, lines: List[str]) -> List[Dict]:
+        """Build project entries from the Projects section lines"""
         projects = []
-        try:
-            lines = all_text.split('\n')
-            proj_started = False
-            current_proj = None
-            
-            for line in lines:
-                line = line.strip()
-                
-                if 'Projects' in line:
-                    proj_started = True
-                    continue
-                
-                if proj_started and any(section in line for section in ['Languages', 'Recommendations', 'Skills']):
-                    if current_proj and current_proj.get('name'):
-                        projects.append(current_proj)
-                    break
-                
-                if proj_started and line and len(line) > 3:
-                    if 'name' not in (current_proj or {}):
-                        current_proj = {'name': line}
-                    elif current_proj and 'description' not in current_proj:
-                        current_proj['description'] = line
-            
-            if current_proj and current_proj.get('name'):
-                projects.append(current_proj)
-            
-            return projects
-            
-        except Exception as e:
-            logger.warning(f"Error extracting projects: {e}")
-            return projects
+        current_proj = None
+        for line in lines:
+            if len(line) <= 3:
+                continue
+            if 'name' not in (current_proj or {}):
+                current_proj = {'name': line}
+            elif 'description' not in current_proj:
+                current_proj['description'] = line
+        if current_proj and current_proj.get('name'):
+            projects.append(current_proj)
+        return projects
     
-    async def _extract_languages(self, page: Page, all_text: str) -> List[str]:
-        """Extract languages"""
-        languages = []
-        try:
-            lines = all_text.split('\n')
-            lang_started = False
-            
-            for line in lines:
-                line = line.strip()
-                
-                if line == 'Languages':
-                    lang_started = True
-                    continue
-                
-                if lang_started:
-                    if any(section in line for section in ['Recommendations', 'Projects', 'Skills', 'Education']):
-                        break
-                    
-                    if line and not any(c in line for c in ['http', 'Follow', 'button']):
-                        if len(line) > 1 and len(line) < 50:
-                            languages.append(line)
-            
-            languages = list(dict.fromkeys(languages))  # Remove duplicates
-            
-        except Exception as e:
-            logger.warning(f"Error extracting languages: {e}")
-        
-        return languages
+    def _finalize_languages(self, lines: List[str]) -> List[str]:
+        """Build the languages list from the Languages section lines"""
+        # Dict keys keep first-seen order and drop duplicates in the same pass
+        languages = {
+            line: None for line in lines
+            if 1 < len(line) < 50 and _LINK_SKIP.isdisjoint(_CASED_WORD_RE.findall(line))
+        }
+        return list(languages)
     
-    async def _extract_recommendations(self, page: Page, all_text: str) -> List[Dict]:
-        """Extract recommendations"""
-        recommendations = []
-        try:
-            # Try to extract from page
-            rec_data = await page.evaluate("""
-                () => {
-                    const recs = [];
-                    const divs = document.querySelectorAll('[class*="recommendation"]');
-                    
-                    for (let div of divs) {
-                        const text = div.innerText;
-                        if (text && text.length > 20) {
-                            recs.push({text: text.substring(0, 500)});
-                        }
-                    }
-                    return recs;
-                }
-            """)
-            
-            recommendations = rec_data[:5] if rec_data else []
-            
-        except Exception as e:
-            logger.debug(f"Error extracting recommendations: {e}")
+    def parse_contact_info(self, contact_text: str, include_raw: bool = False) -> Dict[str, any]:
+        """Parse comprehensive contact info from modal/overlay text - extracts ALL contact types
         
-        return recommendations
-    
-    async def _extract_contact_info_from_page(self, page: Page, all_text: str) -> Optional[Dict]:
-        """Try to extract LinkedIn profile URL from the page (visible without modal)"""
-        try:
-            contact_info = {}
-            
-            # LinkedIn profile URL patterns (may or may not have https://)
-            url_patterns = [
-                r'https?://(?:www\.)?linkedin\.com/in/[\w\-]+',  # Full URL with https
-                r'linkedin\.com/in/[\w\-]+',  # URL without https
-            ]
-            
-            # Search in all_text first (most reliable as it's visible text)
-            for pattern in url_patterns:
-                linkedin_match = re.search(pattern, all_text, re.IGNORECASE)
-                if linkedin_match:
-                    url = linkedin_match.group()
-                    # Ensure it has https:// prefix
-                    if not url.startswith('http'):
-                        url = 'https://www.' + url
-                    contact_info['linkedin_url'] = url
-                    logger.debug(f"Found LinkedIn URL in text: {contact_info['linkedin_url']}")
-                    return contact_info
-            
-            # If not found in text, try in page HTML
-            try:
-                page_html = await page.content()
-                for pattern in url_patterns:
-                    linkedin_match = re.search(pattern, page_html, re.IGNORECASE)
-                    if linkedin_match:
-                        url = linkedin_match.group()
-                        # Ensure it has https:// prefix
-                        if not url.startswith('http'):
-                            url = 'https://www.' + url
-                        contact_info['linkedin_url'] = url
-                        logger.debug(f"Found LinkedIn URL in HTML: {contact_info['linkedin_url']}")
-                        return contact_info
-            except:
-                pass
-            
-            # Return None if nothing found
-            logger.debug("LinkedIn URL not found on page")
-            return None
-            
-        except Exception as e:
-            logger.debug(f"Error extracting contact info from page: {e}")
-            return None
-    
-    def parse_contact_info(self, contact_text: str) -> Dict[str, any]:
-        """Parse comprehensive contact info from modal/overlay text - extracts ALL contact types"""
+        Args:
+            contact_text: Overlay text, ideally starting at its "Contact info" title
+            include_raw: Keep the cleaned overlay text under 'raw_text' (off by default so
+                stored profiles do not each carry a copy of the modal)
+        """
         contact_info = {}
-        try:
-            if not contact_text:
-                return contact_info
-            
-            # Clean up the raw text by extracting only the relevant section
-            # Find the "Contact info" section and extract content between it and the next major section
-            lines = contact_text.split('\n')
-            
-            # Find the contact info section
-            contact_section_start = -1
-            for i, line in enumerate(lines):
-                if 'contact info' in line.lower():
-                    contact_section_start = i
-                    break
-            
-            # If we found contact section, extract content after it until we hit navigation or end
-            if contact_section_start >= 0:
-                contact_lines = []
-                for i in range(contact_section_start + 1, len(lines)):
-                    line = lines[i]
-                    # Stop at common section markers
-                    if any(marker in line.lower() for marker in ['about', 'experience', 'education', 'skills', 'recommendations', 'causes']):
-                        break
-                    # Add non-empty lines
-                    if line.strip() and len(line.strip()) > 1:
-                        contact_lines.append(line.strip())
-                
-                # Reconstruct cleaned contact text
-                if contact_lines:
-                    contact_text = '\n'.join(contact_lines)
-            
-            # Store raw text for reference (cleaned version)
-            contact_info['raw_text'] = contact_text
-            
-            # ========== EMAIL EXTRACTION ==========
-            email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-            emails = re.findall(email_pattern, contact_text)
-            contact_info['emails'] = emails if emails else ['N/A']
-            
-            # ========== PHONE EXTRACTION (Multiple) ==========
-            phones = []
-            phone_patterns = [
-                r'(?:phone|tel|mobile)[:\s]+(\+?[\d\s.\-()]{8,})',  # Labeled phones
-                r'\+[\d]{1,3}[\d\s.\-()]{8,}',  # International format
-                r'(?:^|\s)[\d]{3}[-.]?[\d]{3}[-.]?[\d]{4}(?:\s|$)',  # Standard format
-                r'(?:^|\s)\([\d]{3}\)[\s]?[\d]{3}[-.][\d]{4}(?:\s|$)',  # (XXX) XXX-XXXX
-            ]
-            for pattern in phone_patterns:
-                matches = re.findall(pattern, contact_text, re.IGNORECASE | re.MULTILINE)
-                phones.extend(matches)
-            contact_info['phones'] = list(set([p.strip() for p in phones])) if phones else ['N/A']
-            
-            # ========== LINKEDIN URL EXTRACTION (Multiple) ==========
-            linkedin_urls = re.findall(
-                r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w\-]+',
-                contact_text,
-                re.IGNORECASE
-            )
-            # Also extract just the username if preceded by linkedin.com/in/
-            linkedin_usernames = re.findall(
-                r'linkedin\.com/in/([\w\-]+)',
-                contact_text,
-                re.IGNORECASE
-            )
-            
-            # Ensure https:// prefix for full URLs
-            linkedin_urls = list(set([
-                (u if u.startswith('http') else 'https://' + u) 
-                for u in linkedin_urls
-            ]))
-            
-            # Add usernames as full URLs if not already present
-            for username in linkedin_usernames:
-                full_url = f'https://linkedin.com/in/{username}'
-                if full_url not in linkedin_urls:
-                    linkedin_urls.append(full_url)
-            
-            contact_info['linkedin_urls'] = list(set(linkedin_urls)) if linkedin_urls else ['N/A']
-            
-            # ========== GITHUB EXTRACTION (Multiple) ==========
-            github_urls = re.findall(
-                r'https?://(?:www\.)?github\.com/[\w\-]+|github\.com/[\w\-]+',
-                contact_text,
-                re.IGNORECASE
-            )
-            github_urls = [
-                (u if u.startswith('http') else 'https://' + u) 
-                for u in github_urls
-            ]
-            contact_info['github_urls'] = list(set(github_urls)) if github_urls else ['N/A']
-            
-            # ========== WEBSITES EXTRACTION (Multiple) ==========
-            all_urls = re.findall(r'https?://[^\s<>"\)]+', contact_text)
-            websites = []
-            for url in all_urls:
-                # Exclude LinkedIn and GitHub URLs
-                if not any(x in url.lower() for x in ['linkedin', 'github']):
-                    # Clean up URL
-                    url = url.rstrip('.,;:\'")')
-                    if len(url) > 7:  # At least http://a.b
-                        websites.append(url)
-            
-            # Also extract domain names without http:// (like cuet.ac.bd, maksudcse.wordpress.com)
-            # More flexible pattern that captures common domain extensions
-            domain_pattern = r'\b([a-zA-Z0-9][\w\-]{0,62}(?:\.[a-zA-Z0-9][\w\-]{0,62})*\.(?:ac\.bd|com|org|net|edu|io|co|bd|wordpress\.com|github\.io|dev|app|in|us|uk|au|ca|de|fr|jp|cn|ru|in|tv|xyz|info|biz|name|me|cc))\b'
-            domains = re.findall(domain_pattern, contact_text, re.IGNORECASE | re.MULTILINE)
-            
-            # Filter out known non-website domains and duplicates
-            filtered_domains = []
-            for domain in domains:
-                domain_lower = domain.lower()
-                # Exclude common noise domains
-                if not any(x in domain_lower for x in ['linkedin', 'github', 'facebook', 'twitter', 'instagram', 'youtube', 'corp']):
-                    filtered_domains.append(domain)
-            
-            websites.extend(filtered_domains)
-            contact_info['websites'] = list(set(websites)) if websites else ['N/A']
-            
-            # ========== TWITTER EXTRACTION ==========
-            twitter_patterns = [
-                r'(?:twitter\.com/|@)(?P<handle>[\w\-]{1,15})',
-                r'https?://(?:www\.)?twitter\.com/[\w\-]+',
-            ]
-            twitter_handles = []
-            for pattern in twitter_patterns:
-                matches = re.findall(pattern, contact_text, re.IGNORECASE)
-                twitter_handles.extend(matches)
-            contact_info['twitter'] = list(set(twitter_handles)) if twitter_handles else ['N/A']
-            
-            # ========== INSTAGRAM EXTRACTION ==========
-            instagram_patterns = [
-                r'(?:instagram\.com/|instagram\s+handle\s*:\s*)(?P<handle>[\w\.]{1,30})',
-                r'instagram\s*:\s*(?P<handle>[\w\.]+)',
-            ]
-            insta_handles = []
-            for pattern in instagram_patterns:
-                matches = re.findall(pattern, contact_text, re.IGNORECASE)
-                insta_handles.extend(matches)
-            contact_info['instagram'] = list(set(insta_handles)) if insta_handles else ['N/A']
-            
-            # ========== FACEBOOK EXTRACTION ==========
-            facebook_patterns = [
-                r'(?:facebook\.com/|facebook\s+:\s*)(?P<handle>[\w\.\-]+)',
-                r'facebook\s*:\s*(?P<handle>[\w\.\-]+)',
-            ]
-            fb_handles = []
-            for pattern in facebook_patterns:
-                matches = re.findall(pattern, contact_text, re.IGNORECASE)
-                fb_handles.extend(matches)
-            contact_info['facebook'] = list(set(fb_handles)) if fb_handles else ['N/A']
-            
-            # ========== WHATSAPP EXTRACTION ==========
-            whatsapp_patterns = [
-                r'(?:whatsapp|wa\.me)[:\s/]+(\+?[\d\s.\-()]{8,})',
-                r'whatsapp\s*:\s*(\+?[\d\s.\-()]+)',
-            ]
-            whatsapp_nums = []
-            for pattern in whatsapp_patterns:
-                matches = re.findall(pattern, contact_text, re.IGNORECASE)
-                whatsapp_nums.extend(matches)
-            contact_info['whatsapp'] = list(set([w.strip() for w in whatsapp_nums])) if whatsapp_nums else ['N/A']
-            
-            # ========== TELEGRAM EXTRACTION ==========
-            telegram_patterns = [
-                r'(?:telegram|t\.me)[:\s/]+(?P<handle>[\w\-]{5,})',
-                r'telegram\s*:\s*(?P<handle>[\w\-]+)',
-            ]
-            tg_handles = []
-            for pattern in telegram_patterns:
-                matches = re.findall(pattern, contact_text, re.IGNORECASE)
-                tg_handles.extend(matches)
-            contact_info['telegram'] = list(set(tg_handles)) if tg_handles else ['N/A']
-            
-            # ========== BIRTHDAY EXTRACTION ==========
-            birthday_patterns = [
-                r'(?:birthday|born|dob|date of birth)[:\s]+([A-Za-z]+\s+\d{1,2})',  # Month Day (e.g., April 8)
-                r'\b([A-Za-z]+\s+\d{1,2})\b(?=\s|$)',  # Month Day anywhere
-                r'(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})',  # DD-MM-YYYY or MM/DD/YY
-                r'([A-Za-z]+\s+\d{1,2},?\s+\d{4})',  # Month Day, Year
-            ]
-            birthdays = []
-            for pattern in birthday_patterns:
-                matches = re.findall(pattern, contact_text, re.IGNORECASE | re.MULTILINE)
-                birthdays.extend(matches)
-            
-            # Filter to valid months to avoid false positives
-            valid_months = ['january', 'february', 'march', 'april', 'may', 'june', 
-                          'july', 'august', 'september', 'october', 'november', 'december',
-                          'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
-            birthdays = [b for b in birthdays if any(month in b.lower() for month in valid_months)]
-            contact_info['birthday'] = list(set([b.strip() for b in birthdays])) if birthdays else ['N/A']
-            
-            # ========== SKYPE EXTRACTION ==========
-            skype_patterns = [
-                r'(?:skype)[:\s]+(?P<handle>[\w\-\.]+)',
-                r'skype\s*:\s*(?P<handle>[\w\-\.]+)',
-            ]
-            skype_handles = []
-            for pattern in skype_patterns:
-                matches = re.findall(pattern, contact_text, re.IGNORECASE)
-                skype_handles.extend(matches)
-            contact_info['skype'] = list(set(skype_handles)) if skype_handles else ['N/A']
-            
-            # ========== YOUTUBE EXTRACTION ==========
-            youtube_urls = re.findall(
-                r'https?://(?:www\.)?youtube\.com/(?:channel/|c/|user/)?[\w\-]+',
-                contact_text,
-                re.IGNORECASE
-            )
-            contact_info['youtube'] = list(set(youtube_urls)) if youtube_urls else ['N/A']
-            
-            # ========== TWITTER PROFILE EXTRACTION ==========
-            twitter_urls = re.findall(
-                r'https?://(?:www\.)?twitter\.com/[\w\-]+',
-                contact_text,
-                re.IGNORECASE
-            )
-            contact_info['twitter_url'] = list(set(twitter_urls)) if twitter_urls else ['N/A']
-            
-            # ========== LINKEDIN PROFILE URL (Primary) ==========
-            if contact_info['linkedin_urls'][0] != 'N/A':
-                contact_info['linkedin_url'] = contact_info['linkedin_urls'][0]
-            else:
-                contact_info['linkedin_url'] = 'N/A'
-            
-            logger.debug(f"Parsed comprehensive contact info with {len(contact_info)} fields")
+        if not contact_text:
             return contact_info
-            
-        except Exception as e:
-            logger.debug(f"Error parsing contact info: {e}")
-            return {'raw_text': contact_text, 'error': str(e)} if contact_text else {}
+        
+        if not isinstance(contact_text, str):
+            error = f"expected str, got {type(contact_text).__name__}"
+            logger.debug(f"Error parsing contact info: {error}")
+            return {'raw_text': contact_text, 'error': error} if include_raw else {'error': error}
+        
+        # Clean up the raw text by extracting only the relevant section:
+        # the content between "Contact info" and the next major section.
+        # One streaming pass - find the title, collect, stop at the first section marker
+        contact_lines = None
+        for line in contact_text.splitlines():
+            line_lower = line.lower()
+            if contact_lines is None:
+                if 'contact info' in line_lower:
+                    contact_lines = []
+                continue
+            # Stop at common section markers
+            if any(marker in line_lower for marker in _CONTACT_STOP_MARKERS):
+                break
+            # Add non-empty lines
+            line = line.strip()
+            if len(line) > 1:
+                contact_lines.append(line)
+        
+        # Reconstruct cleaned contact text
+        if contact_lines:
+            contact_text = '\n'.join(contact_lines)
+        
+        # Store raw text for reference (cleaned version) when asked to
+        if include_raw:
+            contact_info['raw_text'] = contact_text
+        
+        # Cheap literal probes over the whole blob: a field whose required literal is
+        # missing skips its regex scan (most overlays hold only a few contact types)
+        lowered = contact_text.lower()
+        has_digit = bool(_HAS_DIGIT(contact_text))
+        
+        # ========== EMAIL EXTRACTION ==========
+        emails = _EMAIL_RE.findall(contact_text) if '@' in contact_text else []
+        contact_info['emails'] = emails if emails else ['N/A']
+        
+        # ========== PHONE EXTRACTION (Multiple) ==========
+        phones = [m.group('labeled') or m.group() for m in _PHONE_RE.finditer(contact_text)] if has_digit else []
+        contact_info['phones'] = list(set([p.strip() for p in phones])) if phones else ['N/A']
+        
+        # ========== LINKEDIN URL EXTRACTION (Multiple) ==========
+        # One scan yields each URL as written plus its username
+        linkedin_matches = list(_CONTACT_LINKEDIN_RE.finditer(contact_text)) if 'linkedin.com/in/' in lowered else []
+        linkedin_urls = [m.group() for m in linkedin_matches]
+        linkedin_usernames = [m.group(1) for m in linkedin_matches]
+        
+        # Ensure https:// prefix for full URLs
+        linkedin_urls = list(set([
+            (u if u.startswith('http') else 'https://' + u) 
+            for u in linkedin_urls
+        ]))
+        
+        # Add usernames as full URLs if not already present
+        for username in linkedin_usernames:
+            full_url = f'https://linkedin.com/in/{username}'
+            if full_url not in linkedin_urls:
+                linkedin_urls.append(full_url)
+        
+        contact_info['linkedin_urls'] = list(set(linkedin_urls)) if linkedin_urls else ['N/A']
+        
+        # ========== GITHUB EXTRACTION (Multiple) ==========
+        github_urls = _GITHUB_RE.findall(contact_text) if 'github.com/' in lowered else []
+        github_urls = [
+            (u if u.startswith('http') else 'https://' + u) 
+            for u in github_urls
+        ]
+        contact_info['github_urls'] = list(set(github_urls)) if github_urls else ['N/A']
+        
+        # ========== WEBSITES EXTRACTION (Multiple) ==========
+        all_urls = _HTTP_URL_RE.findall(contact_text) if 'http' in contact_text else []
+        websites = []
+        for url in all_urls:
+            # Exclude LinkedIn and GitHub URLs
+            url_lower = url.lower()
+            if 'linkedin' not in url_lower and 'github' not in url_lower:
+                # Clean up URL
+                url = url.rstrip('.,;:\'")')
+                try:
+                    has_host = bool(urlparse(url).netloc)  # Not just the scheme
+                except ValueError:  # Malformed, e.g. an unclosed IPv6 bracket
+                    continue
+                if has_host:
+                    websites.append(url)
+        
+        # Also extract domain names without http:// (like cuet.ac.bd, maksudcse.wordpress.com)
+        domains = _DOMAIN_RE.findall(contact_text) if '.' in contact_text else []
+        
+        # Filter out known non-website domains and duplicates
+        filtered_domains = []
+        for domain in domains:
+            domain_lower = domain.lower()
+            # Exclude common noise domains
+            if not any(x in domain_lower for x in _NOISE_DOMAINS):
+                filtered_domains.append(domain)
+        
+        websites.extend(filtered_domains)
+        contact_info['websites'] = list(set(websites)) if websites else ['N/A']
+        
+        # ========== TWITTER EXTRACTION ==========
+        twitter_handles = []
+        if '@' in contact_text or 'twitter.com/' in lowered:
+            for pattern in _TWITTER_RES:
+                twitter_handles.extend(pattern.findall(contact_text))
+        contact_info['twitter'] = list(set(twitter_handles)) if twitter_handles else ['N/A']
+        
+        # ========== INSTAGRAM EXTRACTION ==========
+        insta_handles = []
+        if 'instagram' in lowered:
+            for pattern in _INSTAGRAM_RES:
+                insta_handles.extend(pattern.findall(contact_text))
+        contact_info['instagram'] = list(set(insta_handles)) if insta_handles else ['N/A']
+        
+        # ========== FACEBOOK EXTRACTION ==========
+        fb_handles = []
+        if 'facebook' in lowered:
+            for pattern in _FACEBOOK_RES:
+                fb_handles.extend(pattern.findall(contact_text))
+        contact_info['facebook'] = list(set(fb_handles)) if fb_handles else ['N/A']
+        
+        # ========== WHATSAPP EXTRACTION ==========
+        whatsapp_nums = []
+        if 'whatsapp' in lowered or 'wa.me' in lowered:
+            for pattern in _WHATSAPP_RES:
+                whatsapp_nums.extend(pattern.findall(contact_text))
+        contact_info['whatsapp'] = list(set([w.strip() for w in whatsapp_nums])) if whatsapp_nums else ['N/A']
+        
+        # ========== TELEGRAM EXTRACTION ==========
+        tg_handles = []
+        if 'telegram' in lowered or 't.me' in lowered:
+            for pattern in _TELEGRAM_RES:
+                tg_handles.extend(pattern.findall(contact_text))
+        contact_info['telegram'] = list(set(tg_handles)) if tg_handles else ['N/A']
+        
+        # ========== BIRTHDAY EXTRACTION ==========
+        birthdays = []
+        if has_digit:
+            for pattern in _BIRTHDAY_RES:
+                birthdays.extend(pattern.findall(contact_text))
+        
+        # Filter to valid months to avoid false positives
+        valid_birthdays = []
+        for birthday in birthdays:
+            birthday_lower = birthday.lower()
+            if any(month in birthday_lower for month in _MONTH_NAMES):
+                valid_birthdays.append(birthday)
+        birthdays = valid_birthdays
+        contact_info['birthday'] = list(set([b.strip() for b in birthdays])) if birthdays else ['N/A']
+        
+        # ========== SKYPE EXTRACTION ==========
+        skype_handles = []
+        if 'skype' in lowered:
+            for pattern in _SKYPE_RES:
+                skype_handles.extend(pattern.findall(contact_text))
+        contact_info['skype'] = list(set(skype_handles)) if skype_handles else ['N/A']
+        
+        # ========== YOUTUBE EXTRACTION ==========
+        youtube_urls = _YOUTUBE_RE.findall(contact_text) if 'youtube.com/' in lowered else []
+        contact_info['youtube'] = list(set(youtube_urls)) if youtube_urls else ['N/A']
+        
+        # ========== TWITTER PROFILE EXTRACTION ==========
+        twitter_urls = _TWITTER_URL_RE.findall(contact_text) if 'twitter.com/' in lowered else []
+        contact_info['twitter_url'] = list(set(twitter_urls)) if twitter_urls else ['N/A']
+        
+        # ========== LINKEDIN PROFILE URL (Primary) ==========
+        if contact_info['linkedin_urls'][0] != 'N/A':
+            contact_info['linkedin_url'] = contact_info['linkedin_urls'][0]
+        else:
+            contact_info['linkedin_url'] = 'N/A'
+        
+        logger.debug(f"Parsed comprehensive contact info with {len(contact_info)} fields")
+        return contact_info
     
     def _calculate_completeness(self, profile_data: Dict) -> int:
         """Calculate profile completeness score (0-100%)"""
-        try:
-            fields = [
-                profile_data.get('name'),
-                profile_data.get('headline'),
-                profile_data.get('location'),
-                profile_data.get('about'),
-                profile_data.get('experience'),
-                profile_data.get('education'),
-                profile_data.get('skills'),
-            ]
-            
-            # Count non-empty fields
-            filled = sum(1 for field in fields if field)
-            completeness = (filled / len(fields)) * 100
-            
-            return int(completeness)
-            
-        except Exception as e:
-            logger.debug(f"Error calculating completeness: {e}")
-            return 0
+        # One bit per filled field, then a popcount - no temporary list or generator
+        mask = 0
+        for i, key in enumerate(COMPLETENESS_FIELDS):
+            if profile_data.get(key):
+                mask |= 1 << i
+        return bin(mask).count('1') * 100 // _COMPLETENESS_COUNT
 
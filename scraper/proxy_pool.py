@@ -0,0 +1,53 @@
+"""
+Rolling Proxy Pool
+- Weighted random rotation between proxy servers
+- Scores rise on successful navigations and halve on blocks/timeouts
+"""
+
+import random
+from typing import Dict, Iterable, Optional, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ProxyPool:
+    """Pick proxies in proportion to how well they have been working"""
+
+    INITIAL_SCORE = 1.0
+    MIN_SCORE = 0.05  # never fully drop a proxy; it may recover later
+    MAX_SCORE = 10.0
+
+    def __init__(self, proxies: Iterable[str]):
+        self.scores: Dict[str, float] = {p: self.INITIAL_SCORE for p in proxies if p}
+        if not self.scores:
+            raise ValueError("ProxyPool needs at least one proxy server")
+
+    @classmethod
+    def from_setting(cls, setting: Union[str, Iterable[str], None]) -> Optional['ProxyPool']:
+        """Build a pool from a single proxy URL or a list of them (None if empty)"""
+        if not setting:
+            return None
+        if isinstance(setting, str):
+            setting = [setting]
+        proxies = [p for p in setting if p]
+        return cls(proxies) if proxies else None
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def pick(self) -> str:
+        """Choose a proxy, weighted by its current score"""
+        proxies = list(self.scores)
+        return random.choices(proxies, weights=[self.scores[p] for p in proxies])[0]
+
+    def reward(self, proxy: Optional[str]):
+        """Promote a proxy after a successful navigation"""
+        if proxy in self.scores:
+            self.scores[proxy] = min(self.MAX_SCORE, self.scores[proxy] + 1.0)
+
+    def penalize(self, proxy: Optional[str]):
+        """Demote a proxy after a block or timeout"""
+        if proxy in self.scores:
+            self.scores[proxy] = max(self.MIN_SCORE, self.scores[proxy] / 2)
+            logger.debug(f"Proxy penalized: {proxy} (score {self.scores[proxy]:.2f})")
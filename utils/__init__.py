@@ -2,16 +2,25 @@
 Utils module initialization
 """
 
-from .logger import setup_logging, get_logger
+from .logger import setup_logging, shutdown_logging, get_logger
 from .config import Config
-from .exporter import DataExporter
 from .helpers import (
     print_banner, print_config_info, format_time,
-    extract_url_profile_id, sanitize_filename, retry_async
+    extract_url_profile_id, sanitize_filename, retry_async,
+    format_timestamp_ns, with_scraped_at, async_input
 )
 
 __all__ = [
-    "setup_logging", "get_logger", "Config", "DataExporter",
+    "setup_logging", "shutdown_logging", "get_logger", "Config", "DataExporter",
     "print_banner", "print_config_info", "format_time",
-    "extract_url_profile_id", "sanitize_filename", "retry_async"
+    "extract_url_profile_id", "sanitize_filename", "retry_async",
+    "format_timestamp_ns", "with_scraped_at", "async_input"
 ]
+
+
+def __getattr__(name):
+    # DataExporter pulls in pandas/openpyxl, so import it only when requested
+    if name == "DataExporter":
+        from .exporter import DataExporter
+        return DataExporter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -21,16 +21,22 @@ class Config:
             'scraping': {
                 'headless': False,
                 'max_profiles_per_search': 100,
+                'requests_per_minute': 3,
                 'delay_between_profiles': (15, 30),
                 'max_retries': 3,
                 'timeout': 60000,
                 'use_stealth': True,
+                'use_voyager_api': False,
+                'cache_profiles': True,
             },
             'browser': {
                 'viewport_width': 1920,
                 'viewport_height': 1080,
                 'use_proxy': False,
                 'proxy_server': '',
+                'proxy_servers': [],
+                'block_resources': ['image', 'font', 'media'],
+                'personas': [],
             },
             'database': {
                 'path': 'data/linkedin_scraper.db',
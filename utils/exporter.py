@@ -8,6 +8,8 @@ from pathlib import Path
 from typing import List, Dict, Optional
 import logging
 
+from .helpers import with_scraped_at
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -37,7 +39,7 @@ class DataExporter:
             filepath = self.export_path / filename
             
             with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(profiles, f, indent=2, ensure_ascii=False)
+                json.dump([with_scraped_at(p) for p in profiles], f, indent=2, ensure_ascii=False)
             
             logger.info(f"Exported {len(profiles)} profiles to {filepath}")
             return True
@@ -193,7 +195,7 @@ class DataExporter:
         flat['total_languages'] = len(languages)
         
         # Metadata
-        flat['scraped_at'] = profile.get('scraped_at', '')
+        flat['scraped_at'] = with_scraped_at(profile).get('scraped_at', '')
         flat['extraction_method'] = profile.get('extraction_method', 'text-based')
         
         return flat
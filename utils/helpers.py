@@ -4,9 +4,10 @@ Utility helper functions
 
 import asyncio
 import random
+import threading
 import hashlib
 from datetime import datetime
-from typing import Any, List
+from typing import Any, Dict, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -22,6 +23,21 @@ def get_timestamp() -> str:
     return datetime.now().isoformat()
 
 
+def format_timestamp_ns(timestamp_ns: Optional[int]) -> str:
+    """Format a time.time_ns() value like datetime.now().isoformat() (local time)"""
+    if timestamp_ns is None:
+        return ''
+    seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1000).isoformat()
+
+
+def with_scraped_at(profile: Dict) -> Dict:
+    """Profile with its 'scraped_at' string filled in from 'scraped_at_ns' (for persisting)"""
+    if 'scraped_at' in profile or 'scraped_at_ns' not in profile:
+        return profile
+    return {**profile, 'scraped_at': format_timestamp_ns(profile['scraped_at_ns'])}
+
+
 def format_time(seconds: float) -> str:
     """Format seconds to readable format"""
     if seconds < 60:
@@ -64,6 +80,34 @@ def retry_async(max_retries: int = 3, delay: float = 1.0):
     return decorator
 
 
+async def async_input(prompt: str = '') -> str:
+    """input() that leaves the event loop free while the user is typing.
+
+    Reads on a daemon thread (not the default executor) so a Ctrl+C at the
+    prompt does not leave shutdown waiting for the blocked read.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def _settle(result, error):
+        if not future.done():
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+    
+    def _read():
+        try:
+            line = input(prompt)
+        except BaseException as e:  # EOFError / KeyboardInterrupt reach the awaiting caller
+            loop.call_soon_threadsafe(_settle, None, e)
+        else:
+            loop.call_soon_threadsafe(_settle, line, None)
+    
+    threading.Thread(target=_read, name='async-input', daemon=True).start()
+    return await future
+
+
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename for filesystem"""
     import re
@@ -111,6 +155,7 @@ def print_config_info(config):
     print(f"Headless Mode: {config.HEADLESS}")
     print(f"Max Profiles per Search: {config.scraping['max_profiles_per_search']}")
     print(f"Delay Between Profiles: {config.scraping['delay_between_profiles']}")
+    print(f"Requests per Minute: {config.scraping['requests_per_minute']}")
     print(f"Stealth Mode: {config.scraping['use_stealth']}")
     print(f"Human Behavior: {config.anti_detection['human_behavior']}")
     print(f"Database: {config.database['path']}")
@@ -4,21 +4,30 @@ Logging setup and configuration
 
 import logging
 import logging.handlers
+import queue
 from pathlib import Path
+from typing import Optional
+
+# Background listener that owns the file/console handlers, and the root handler feeding it
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
 
 def setup_logging(log_file: str = 'logs/scraper.log', level: str = 'INFO') -> logging.Logger:
-    """Setup logging configuration"""
+    """Setup logging configuration on the root logger (all modules log through it)"""
+    global _queue_listener, _queue_handler
     
     # Create logs directory
     log_path = Path(log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
     
     # Create logger
-    logger = logging.getLogger(__name__)
+    logger = logging.getLogger()
     logger.setLevel(getattr(logging, level))
     
-    # Avoid duplicate handlers
-    if logger.handlers:
+    # Avoid duplicate handlers: a repeated call only updates the level
+    if _queue_listener is not None:
+        for handler in _queue_listener.handlers:
+            handler.setLevel(getattr(logging, level))
         return logger
     
     # File handler with rotation
@@ -42,12 +51,36 @@ def setup_logging(log_file: str = 'logs/scraper.log', level: str = 'INFO') -> lo
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
     
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Records are queued by the caller and written by a listener thread,
+    # so slow file/tty writes never block the event loop
+    log_queue = queue.SimpleQueue()
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    logger.addHandler(_queue_handler)
+    
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
     
     return logger
 
 
+def shutdown_logging():
+    """Detach the root queue handler, flush queued records and stop the listener thread"""
+    global _queue_listener, _queue_handler
+    
+    # Detach first so nothing is queued after the listener has drained
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get logger instance"""
     return logging.getLogger(name)